@@ -4,18 +4,606 @@ import re
 import json
 import csv
 import logging
-from typing import List, Dict, Optional
-import pandas as pd
+import queue
+import atexit
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import quote_plus
+
+# Optional C JSON encoder for save_to_json; the stdlib encoder is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from selenium.webdriver.common.driver_finder import DriverFinder
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 from fake_useragent import UserAgent
-from selenium.webdriver.common.action_chains import ActionChains
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+
+
+# Number of warm browser sessions kept per headless mode for scrapers created
+# with reuse_driver=True
+_DRIVER_POOL_SIZE = 4
+
+# ChromeDriver service shared by every session in this process
+_SERVICE = None
+_SERVICE_LOCK = threading.Lock()
+
+# ChromeDriver path, resolved at most once per process (CHROMEDRIVER_PATH skips the lookup)
+_DRIVER_PATH = os.environ.get('CHROMEDRIVER_PATH')
+
+# Chrome launch flags: stealth, a fixed viewport, and no background networking,
+# sync, translation or other services that compete with scraping for CPU
+_CHROME_ARGS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--log-level=3',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-extensions',
+    '--disable-plugins',
+    '--disable-gpu',
+    '--window-size=1920,1080',
+    '--disable-background-networking',
+    '--disable-sync',
+    '--disable-default-apps',
+    '--no-first-run',
+    '--disable-translate',
+    '--disable-features=Translate,BackForwardCache,MediaRouter,OptimizationHints',
+)
+
+# Fields collected for every business, in output column order
+_BUSINESS_FIELDS = (
+    'name', 'rating', 'reviews_count', 'category', 'address', 'phone', 'website',
+    'business_website_url', 'hours', 'price_range', 'description', 'index'
+)
+
+# Every field present up front and empty, so extraction only overwrites values
+_BUSINESS_TEMPLATE = dict.fromkeys(_BUSINESS_FIELDS, '')
+
+# Precompiled patterns shared by the extraction helpers
+_RATING_RE = re.compile(r'(\d+\.?\d*)')
+_REVIEWS_RE = re.compile(r'[\(\s](\d+,?\d*)[\)\s]|(\d+,?\d+)\s*review|(\d+,?\d+)')
+_COUNT_RE = re.compile(r'[\(\s](\d+)[\)\s]')
+_NUMBER_RE = re.compile(r'(\d+)')
+_RATING_PREFIX_RE = re.compile(r'^\d+\.\d+\s')
+_COUNT_PREFIX_RE = re.compile(r'^\(\d+\)')
+_DOMAIN_NAME_RE = re.compile(r'^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_PHONE_RE = re.compile(r'[\+\(\)\-\s\d]{10,}')
+_SAFE_NAME_RE = re.compile(r'[^\w\s-]')
+
+# Rating and review count in a result card's text, matched in one pass with one
+# named group per field (group names are the business_data keys; reviews_text
+# is the "1,234 reviews" form of reviews_count)
+_CARD_TEXT_RE = re.compile(
+    r'^(?P<rating>\d+\.?\d*)\s*(?:stars?)?$'
+    r'|\((?P<reviews_count>\d[\d,]*)\)'
+    r'|(?P<reviews_text>\d[\d,]*)\s*reviews?\b',
+    re.IGNORECASE | re.MULTILINE
+)
+# Price range and hours lines of a card's text. They are searched on their own
+# because they match whole lines, which would hide a review count on the same
+# line (e.g. "Pizza · $$ · (120)") from a combined pattern
+_CARD_LINE_FIELDS = (
+    ('price_range', re.compile(r'^(?=[^\n]{1,19}$)[^\n]*\$[^\n]*$', re.MULTILINE)),
+    ('hours', re.compile(r'^(?=[^\n]{1,99}$)[^\n]*(?:open|close|hours|\b[ap]m\b)[^\n]*$',
+                         re.IGNORECASE | re.MULTILINE)),
+)
+_ADDR_ZIP_RE = re.compile(r'\d+.*\w+.*(?:\d{5}|NY|New York)')
+
+# Keywords that mark a line as a business category (substring matches, case-insensitive):
+# the card text also accepts retail words, the quick-sidebar fallback only food places
+_CATEGORY_WORDS_RE = re.compile(
+    'restaurant|cafe|bar|grill|kitchen|bistro|steakhouse|diner|eatery|bakery|pizzeria|shop|store|market',
+    re.IGNORECASE
+)
+_SIDEBAR_CATEGORY_RE = re.compile(
+    'restaurant|cafe|bar|grill|kitchen|diner|bistro|steakhouse|pizzeria|bakery',
+    re.IGNORECASE
+)
+
+# Website-looking text: a common top-level domain
+_DOMAIN_RE = re.compile(r'\.(?:com|org|net|edu)\b')
+# Link-looking text: a URL scheme or a .com/.org/.net domain
+_WEBSITE_TEXT_RE = re.compile(r'http|\.(?:com|org|net)\b')
+# Google's own links, never a business's website
+_GOOGLE_HOST_RE = re.compile(r'google\.com|maps')
+# Same, substring match including .gov, for sidebar website buttons
+_BUTTON_DOMAIN_RE = re.compile(r'\.(?:com|org|net|edu|gov)')
+
+# Keyword alternations for the card's text lines (substring matches, case-insensitive)
+_ADDR_WORDS_RE = re.compile('street|st|ave|avenue|road|rd|blvd|way|place|drive|dr', re.IGNORECASE)
+_OPEN_CLOSE_RE = re.compile('open|close', re.IGNORECASE)
+
+# Lower-cased once so the scroll loop can compare against lower-cased page text
+_END_OF_LIST_MESSAGES = frozenset(message.lower() for message in (
+    "You've reached the end of the list.",
+    "You've reached the end",
+    "No more results",
+    "End of results",
+    "That's all we found",
+    "No more places to show"
+))
+
+# Single-pass, case-insensitive match for any of the end-of-list messages
+_END_OF_LIST_RE = re.compile('|'.join(map(re.escape, sorted(_END_OF_LIST_MESSAGES))), re.IGNORECASE)
+
+# Static assets never used by the extraction; blocked through CDP.
+# Stylesheets stay enabled because visibility checks depend on layout.
+_BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.webp', '*.gif',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm'
+]
+
+# Probe only the end-of-list banner instead of serialising the whole page;
+# returns the matching message or null.
+_END_OF_LIST_JS = """
+const el = document.querySelector('.m6QErb .HlvSq, .PbZDve');
+const text = el ? (el.innerText || '').toLowerCase() : '';
+return arguments[0].find(m => text.includes(m)) || null;
+"""
+
+# "More results" buttons, in priority order. jQuery-style ':contains()' is not
+# valid CSS (it only ever raised), so it is left out here and below.
+_MORE_RESULTS_SELECTORS = (
+    'button[data-value="See more results"]',
+    '.more-results',
+    '[aria-label*="more"]',
+    'button[jsaction*="more"]'
+)
+# Click the first match of the first selector in arguments[0] whose match is
+# visible; true if one was clicked
+_CLICK_MORE_RESULTS_JS = """
+for (const selector of arguments[0]) {
+    const button = document.querySelector(selector);
+    if (button && button.offsetParent !== null) {
+        button.click();
+        return true;
+    }
+}
+return false;
+"""
+# Selector union for a single find_elements lookup
+_END_OF_LIST_CSS = ', '.join((
+    '[data-value*="end"]',
+    '[aria-label*="end"]',
+    '.section-no-result',
+    '.no-more-results'
+))
+
+
+def _compile_css(*selectors: str) -> Tuple[CSSSelector, ...]:
+    """Compile CSS selectors for lxml, keeping their order."""
+    return tuple(CSSSelector(selector) for selector in selectors)
+
+
+# Compiled once; evaluated against a locally parsed copy of each result card
+_XP_NAME = etree.XPath('.//div[contains(@class,"qBF1Pd")]/text()')
+_XP_RATING = etree.XPath('.//span[contains(@class,"MW4etd")]/text()')
+_XP_REVIEWS = etree.XPath('.//span[contains(@class,"UY7F9")]/text()')
+_XP_CAT = etree.XPath('.//div[contains(@class,"W4Efsd")][1]/div/span[1]/text()')
+_XP_DOMAIN_TEXT = etree.XPath(".//*[contains(text(), '.com') or contains(text(), '.org') or contains(text(), '.net')]")
+_CARD_XPATHS = (
+    ('name', _XP_NAME),
+    ('rating', _XP_RATING),
+    ('reviews_count', _XP_REVIEWS),
+    ('category', _XP_CAT)
+)
+
+# Selector cascades for the lxml snapshots, compiled once at import
+_CARD_LINK_CSS = CSSSelector('a[href*="http"]')
+_CARD_WEBSITE_TEXT_CSS = CSSSelector('.gSkmPd.fontBodySmall.DshQNd, .gSkmPd')
+
+# Sidebar selector cascades per detail field, resolved in the browser by _SIDEBAR_JS
+_SIDEBAR_FIELD_SELECTORS = {
+    'name': (
+        'h1.DUwDvf',
+        'h1[data-attrid="title"]',
+        '.DUwDvf.lfPIob',
+        '[role="main"] h1',
+        '.fontHeadlineSmall',
+        'h1',
+    ),
+    'rating': (
+        '.F7nice span[aria-label*="stars"]',
+        '.F7nice .fontBodyMedium',
+        'span[aria-label*="star"]',
+        '.F7nice span',
+        '.dmRWX .F7nice',
+    ),
+    'reviews_count': (
+        '.F7nice span[aria-label*="reviews"]',
+        'span[aria-label*="reviews"]',
+        'button[aria-label*="reviews"]',
+    ),
+    'category': (
+        'button[jsaction*="category"]',
+        '.DkEaL',
+        'button.DkEaL',
+        '.skqShb button',
+    ),
+    'address': (
+        'button[data-item-id="address"]',
+        'button[aria-label*="Address"]',
+        '.Io6YTe.fontBodyMedium.kR99db.fdkmkc',
+        'button.CsEnBe[aria-label*="Address"]',
+    ),
+    'phone': (
+        'button[data-item-id*="phone"]',
+        'button[aria-label*="Phone"]',
+        'a[href^="tel:"]',
+        'button[aria-label*="Call"]',
+    ),
+    'website': (
+        'a[data-item-id="authority"]',
+        'a[href^="http"]:not([href*="google"])',
+        'button[aria-label*="website"] + div a',
+    ),
+    'hours': (
+        'button[data-item-id="oh"]',
+        'button[aria-label*="hours"]',
+        '.Io6YTe.fontBodyMedium.kR99db.fdkmkc',
+    ),
+    'price_range': (
+        '[aria-label*="Price"]',
+        '.price',
+        '[data-price]',
+    ),
+    'description': (
+        '.wiI7pd',
+        '.VpMB0',
+        '.section-editorial-quote',
+        '.section-editorial-text',
+    ),
+}
+
+_CARD_NAME_CSS = _compile_css(
+    '.fontHeadlineSmall',
+    '.DUwDvf',
+    '[role="heading"]',
+    'h3',
+    'h2',
+    '.qBF1Pd',
+    '.fontBodyMedium',
+    'div.fontBodyMedium > span',
+    '.section-result-title',
+    'a[data-value]',
+)
+
+_CARD_RATING_CSS = _compile_css(
+    '.MW4etd',
+    '.fontBodySmall .MW4etd',
+    '[aria-label*="stars"]',
+    '.review-score',
+    'span[aria-label*="star"]',
+    '.F7nice span',
+    '.fontBodySmall span:first-child',
+)
+
+_CARD_REVIEWS_CSS = _compile_css(
+    'span[aria-label*="reviews"]',
+    'button[aria-label*="reviews"]',
+    '.fontBodySmall span:contains("(")',
+    '.F7nice .fontBodySmall',
+)
+
+_CARD_CATEGORY_CSS = _compile_css(
+    '.fontBodySmall',
+    '.DkEaL',
+    '.W4Efsd:nth-child(2)',
+    '.W4Efsd',
+    'button.DkEaL',
+    '.section-result-category',
+)
+
+# Selector cascades resolved in the browser; the order is the preference order
+_QUICK_RATING_SELECTORS = (
+    '.F7nice span[aria-label*="stars"]',
+    '.F7nice .fontBodyMedium',
+    '[data-value] span',
+    '.aMPvhf-fI6EEc-KVuj8d',
+    'span[role="img"][aria-label*="stars"]',
+)
+
+_QUICK_REVIEWS_SELECTORS = (
+    '.F7nice span[aria-label*="reviews"]',
+    '.F7nice span[aria-label*="review"]',
+    '.UY7F9',
+    'button[aria-label*="reviews"]',
+    'span[aria-label*="review"]',
+)
+
+_QUICK_CATEGORY_SELECTORS = (
+    'button[jsaction*="category"]',
+    '.DkEaL',
+    'button.DkEaL',
+    '.LBgpqf',
+    '[data-value="Categories"] + div',
+    'button[data-value*="category"]',
+    '.skqShb',
+)
+
+_QUICK_ADDRESS_SELECTORS = (
+    'button[data-item-id="address"] .Io6YTe',
+    'button[aria-label*="Address"]',
+    '.Io6YTe',
+    '.LrzXr',
+    'button[data-item-id="address"]',
+    '[data-item-id="address"]',
+)
+
+_QUICK_PHONE_SELECTORS = (
+    'button[data-item-id*="phone"] .Io6YTe',
+    'button[aria-label*="Phone"]',
+    'button[aria-label*="Call"]',
+    '[data-item-id="phone"]',
+    'button[data-item-id="phone"]',
+)
+
+_QUICK_WEBSITE_SELECTORS = (
+    'button[data-item-id*="website"] .Io6YTe',
+    'button[aria-label*="Website"]',
+    'button[data-item-id="website"]',
+    '[data-item-id="website"]',
+    'button[data-item-id="website"] span',
+    'a[href*="http"]',
+    'button[aria-label*="website"]',
+)
+
+_QUICK_HOURS_SELECTORS = (
+    'button[data-item-id*="hours"]',
+    'button[aria-label*="Hours"]',
+    '[data-item-id="hours"]',
+    '.t39EBf',
+)
+
+# Elements holding a business's own website as text, most specific first
+_BUSINESS_WEBSITE_SELECTORS = (
+    '.AeaXub .rogA2c .gSkmPd.fontBodySmall.DshQNd',
+    '.gSkmPd.fontBodySmall.DshQNd',
+    '.rogA2c .gSkmPd',
+    '.Io6YTe + .HMy2Jf + .gSkmPd',
+)
+
+_SIDEBAR_LOADED_SELECTORS = (
+    '[role="main"] > div:nth-child(2)',  # Main sidebar container
+    '.m6QErb[data-value]',  # Sidebar with data
+    '[data-attrid="title"]',  # Business title in sidebar
+    '.DUwDvf.lfPIob',  # Business name
+    '.fontHeadlineSmall',  # Alternative business name
+)
+
+# sidebarHits({field: [selectors]}) gives, per field, the first match of each
+# selector as {selector, text, aria, number, count, href, inner}: number is the first
+# number and count the first bracketed/spaced integer in its text (or aria-label),
+# inner the text of its .Io6YTe child. _SIDEBAR_JS runs it on arguments[0]
+_SIDEBAR_HITS_FN = """
+const sidebarHits = selectorsByField => {
+    const out = {};
+    const bareClass = /^\\.[\\w-]+$/;
+    for (const [field, selectors] of Object.entries(selectorsByField)) {
+        out[field] = [];
+        for (const selector of selectors) {
+            let el = null;
+            try {
+                // Single-class selectors skip the selector engine
+                el = bareClass.test(selector)
+                    ? document.getElementsByClassName(selector.slice(1))[0] || null
+                    : document.querySelector(selector);
+            } catch (e) { continue; }
+            if (!el) continue;
+            const inner = el.querySelector('.Io6YTe');
+            const text = (el.innerText || '').trim();
+            const aria = el.getAttribute('aria-label') || '';
+            const value = text || aria;
+            const number = value.match(/\\d+\\.?\\d*/);
+            const count = value.match(/[(\\s](\\d+)[)\\s]/);
+            out[field].push({
+                selector: selector,
+                text: text,
+                aria: aria,
+                number: number ? number[0] : '',
+                count: count ? count[1] : '',
+                href: el.href || el.getAttribute('href') || '',
+                inner: inner ? (inner.innerText || '').trim() : ''
+            });
+        }
+    }
+    return out;
+};
+"""
+_SIDEBAR_JS = _SIDEBAR_HITS_FN + "return sidebarHits(arguments[0]);"
+
+# Sidebar selectors that only count as loaded once they have text
+_SIDEBAR_TITLE_SELECTORS = ('[data-attrid="title"]', '.DUwDvf.lfPIob', '.fontHeadlineSmall')
+
+# Address/phone/website/hours rows, rendered after the sidebar title
+_SIDEBAR_DETAIL_ROWS = 'button[data-item-id], a[data-item-id]'
+
+# True once any selector in arguments[0] matches a visible element; selectors in
+# arguments[1] must also have text
+_SIDEBAR_LOADED_JS = """
+const needsText = new Set(arguments[1]);
+return arguments[0].some(selector => {
+    const el = document.querySelector(selector);
+    if (!el || !el.getClientRects().length) return false;
+    return !needsText.has(selector) || (el.innerText || '').trim().length > 0;
+});
+"""
+
+# First text node under arguments[0] longer than two characters that isn't just digits
+_FIRST_TEXT_JS = """
+const walker = document.createTreeWalker(arguments[0], NodeFilter.SHOW_TEXT);
+let node;
+while ((node = walker.nextNode())) {
+    const text = node.textContent.trim();
+    if (text.length > 2 && !/^\\d+$/.test(text)) return text;
+}
+return null;
+"""
+
+# All quick-sidebar cascades, resolved together by _first_matches
+_QUICK_SIDEBAR_SELECTORS = {
+    'rating': _QUICK_RATING_SELECTORS,
+    'reviews_count': _QUICK_REVIEWS_SELECTORS,
+    'category': _QUICK_CATEGORY_SELECTORS,
+    'address': _QUICK_ADDRESS_SELECTORS,
+    'phone': _QUICK_PHONE_SELECTORS,
+    'website': _QUICK_WEBSITE_SELECTORS,
+    'hours': _QUICK_HOURS_SELECTORS,
+}
+
+# Title of the business currently shown in the sidebar, used to detect sidebar changes
+_SIDEBAR_TITLE_JS = "const h = document.querySelector('.TIHn2 h1'); return h ? h.innerText : null;"
+
+# Trimmed innerText of every element matching any selector in arguments[0], in selector order
+_TEXTS_JS = """
+const texts = [];
+for (const selector of arguments[0]) {
+    try {
+        document.querySelectorAll(selector).forEach(el => texts.push((el.innerText || '').trim()));
+    } catch (e) {}
+}
+return texts;
+"""
+
+# Bring arguments[0] into view and click it inside the page
+_SCROLL_AND_CLICK_JS = "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();"
+
+# Result card anchor at position arguments[0], or null once past the end
+_CARD_AT_JS = "return document.querySelectorAll('.hfpxzc')[arguments[0]] || null;"
+
+# Escape keypress fired in the page to close any popup
+_ESCAPE_JS = "document.dispatchEvent(new KeyboardEvent('keydown', {key: 'Escape', keyCode: 27, which: 27, bubbles: true}));"
+
+# [innerText, aria-label] of arguments[0], both trimmed/defaulted to ''
+_TEXT_AND_ARIA_JS = """
+const el = arguments[0];
+return [(el.innerText || '').trim(), el.getAttribute('aria-label') || ''];
+"""
+
+# Cards per asynchronous sidebar batch, how long to wait for each sidebar to switch,
+# and then how long for its detail rows
+_SIDEBAR_BATCH_SIZE = 20
+_SIDEBAR_WAIT_MS = 3000
+_SIDEBAR_ROWS_WAIT_MS = 3000
+
+# Click each card position in arguments[0] in turn, wait for the sidebar to
+# switch to it and for its detail rows (arguments[2]), then collect sidebarHits
+# for the selector cascades in arguments[1]; calls back with one
+# {index, hits} per card, or with {error} if the script failed
+_SIDEBAR_BATCH_JS = _SIDEBAR_HITS_FN + """
+const [positions, selectors, rowsSelector, titleWaitMs, rowsWaitMs] = arguments;
+const done = arguments[arguments.length - 1];
+const title = () => { const h = document.querySelector('.TIHn2 h1'); return h ? h.innerText : null; };
+// Resolves once check() holds, re-checked on every DOM change, or after ms
+const waitFor = (check, ms) => new Promise(resolve => {
+    if (check()) return resolve();
+    const observer = new MutationObserver(() => { if (check()) finish(); });
+    const timer = setTimeout(finish, ms);
+    function finish() { clearTimeout(timer); observer.disconnect(); resolve(); }
+    observer.observe(document.body, {subtree: true, childList: true, characterData: true});
+});
+(async () => {
+    const out = [];
+    for (const index of positions) {
+        const card = document.querySelectorAll('.hfpxzc')[index];
+        if (!card) continue;
+        const before = title();
+        card.scrollIntoView({block: 'center'});
+        card.click();
+        await waitFor(() => { const current = title(); return current && current !== before; }, titleWaitMs);
+        // Address, phone, website and hours rows render after the title
+        await waitFor(() => document.querySelector(rowsSelector) !== null, rowsWaitMs);
+        out.push({index: index, hits: sidebarHits(selectors)});
+    }
+    done(out);
+})().catch(e => done({error: String(e)}));
+"""
+
+# True if any visible, enabled "See more results" button is present
+_MORE_RESULTS_AVAILABLE_JS = """
+return Array.from(document.querySelectorAll('button[data-value="See more results"]'))
+    .some(b => b.offsetParent !== null && !b.disabled);
+"""
+
+# Harvest every result card currently rendered in the results panel, starting at
+# index arguments[0], in a single round-trip. Entries are index-aligned with the
+# '.hfpxzc' anchors.
+_CARDS_JS = """
+return Array.from(document.querySelectorAll('.hfpxzc')).slice(arguments[0] || 0).map(el => {
+    const card = el.closest('.Nv2PK') || el.parentElement || el;
+    const q = s => card.querySelector(s);
+    const txt = s => { const e = q(s); return e ? e.innerText.trim() : null; };
+    return {
+        name: el.getAttribute('aria-label'),
+        href: el.href || null,
+        rating: txt('.MW4etd'),
+        reviews: txt('.UY7F9'),
+        category: txt('.W4Efsd:nth-of-type(1) span:nth-child(1)'),
+        address: txt('.W4Efsd:nth-of-type(2) span:last-child')
+    };
+});
+"""
+
+# Fields that make opening a business's sidebar unnecessary once all are known;
+# result cards never carry a phone number, so in practice every card is clicked
+_REQUIRED_FIELDS = ('name', 'rating', 'address', 'phone', 'website')
+
+
+def _extract_business_website(texts) -> str:
+    """First text that looks like a business's own domain rather than a Google link."""
+    for text in texts:
+        if text and _DOMAIN_RE.search(text) and not _GOOGLE_HOST_RE.search(text):
+            return text
+    return ""
+
+
+def _node_text(node) -> str:
+    """Whitespace-normalized text content of an lxml element."""
+    return ' '.join(node.text_content().split())
+
+
+def _count_ascii_digits(buf: bytes) -> int:
+    """Number of ASCII digit bytes in buf; compiled with numba in bulk mode."""
+    n = 0
+    for b in buf:
+        if 48 <= b <= 57:
+            n += 1
+    return n
+
+
+_count_digits_jit = None
+
+
+def _load_digit_counter():
+    """
+    The numba-compiled _count_ascii_digits, built (or loaded from numba's
+    on-disk cache) and warmed on first use; None when numba is not installed.
+    """
+    global _count_digits_jit
+    if _count_digits_jit is None:
+        try:
+            from numba import njit
+        except ImportError:
+            return None
+        counter = njit(cache=True)(_count_ascii_digits)
+        counter(b'0')  # compile now rather than on the first phone number
+        _count_digits_jit = counter
+    return _count_digits_jit
 
 
 class GoogleBusinessScraper:
@@ -24,16 +612,46 @@ class GoogleBusinessScraper:
     directly from Google Maps search results page without opening individual listings.
     """
     
-    def __init__(self, headless: bool = False, timeout: int = 15):
+    # Warm browser sessions handed back by close() when reuse_driver is set, keyed by headless mode
+    _driver_pools = {
+        True: queue.Queue(maxsize=_DRIVER_POOL_SIZE),
+        False: queue.Queue(maxsize=_DRIVER_POOL_SIZE)
+    }
+    
+    # UserAgent database, loaded on first use and shared by all instances
+    _ua = None
+    
+    def __init__(self, headless: bool = False, timeout: int = 15, detail_workers: int = 0,
+                 detail_fields_needed: bool = True, cache_path: Optional[str] = None,
+                 bulk_mode: bool = False, reuse_driver: bool = False):
         """
         Initialize the scraper with Chrome WebDriver settings.
         
         Args:
             headless (bool): Run browser in headless mode
             timeout (int): Default timeout for WebDriver waits
+            detail_workers (int): Extra browser sessions used to open business pages
+                in parallel; 0 reads every sidebar in the main browser
+            detail_fields_needed (bool): Open business sidebars for fields missing from
+                the result cards; False scrapes the result list only, with no clicks
+            cache_path (str): JSON file of previously extracted businesses, keyed by
+                place URL, that is read on start and updated on close
+            bulk_mode (bool): Validate phone numbers with a numba-compiled digit
+                counter (if numba is installed); only pays off on very large scrapes
+            reuse_driver (bool): On close(), park the browser in a per-process session
+                pool for the next scraper instead of quitting it; pooled sessions are
+                quit by close_pool(), which runs at interpreter exit
         """
         self.timeout = timeout
-        self.ua = UserAgent()
+        self.headless = headless
+        self.detail_workers = detail_workers
+        self.detail_fields_needed = detail_fields_needed
+        self.cache_path = cache_path
+        self.bulk_mode = bulk_mode
+        self.reuse_driver = reuse_driver
+        self._count_digits = _load_digit_counter() if bulk_mode else None
+        self._harvested_cards = []
+        self.ua = self._get_ua()
         
         # Setup logging with UTF-8 encoding to handle special characters
         logging.basicConfig(
@@ -46,63 +664,110 @@ class GoogleBusinessScraper:
         )
         self.logger = logging.getLogger(__name__)
         
+        # Extracted businesses by place URL or data-cid, reused instead of re-extracting
+        self._extract_cache = self._load_extract_cache()
+        
         # Setup driver
         self.driver = self._setup_driver(headless)
         self.wait = WebDriverWait(self.driver, timeout)
-        self.actions = ActionChains(self.driver)
+        self._sidebar_wait = WebDriverWait(self.driver, 3, poll_frequency=0.1)
     
-    def _setup_driver(self, headless: bool) -> webdriver.Chrome:
-        """Setup Chrome WebDriver with optimized options."""
-        options = Options()
-        
-        if headless:
-            options.add_argument('--headless')
-        
-        # Chrome options for better performance and stealth
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        options.add_argument(f'--user-agent={self.ua.random}')
-        options.add_argument('--disable-extensions')
-        options.add_argument('--disable-plugins')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--window-size=1920,1080')
-        options.add_argument('--remote-debugging-port=9222')
+    def _load_extract_cache(self) -> Dict[str, Dict]:
+        """Read the on-disk extraction cache, if one is configured and present."""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable cache {self.cache_path}: {e}")
+            return {}
+    
+    def _save_extract_cache(self):
+        """Write the extraction cache back to disk, if one is configured."""
+        if not self.cache_path:
+            return
+        try:
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self._extract_cache, f, ensure_ascii=False)
+        except OSError as e:
+            self.logger.warning(f"Could not write cache {self.cache_path}: {e}")
+    
+    @classmethod
+    def _get_ua(cls) -> UserAgent:
+        """Return the shared UserAgent, building it only once per process."""
+        if cls._ua is None:
+            cls._ua = UserAgent()
+        return cls._ua
+    
+    def _setup_driver(self, headless: bool) -> webdriver.Remote:
+        """Take a warm WebDriver session from the pool, or start a new one."""
+        try:
+            driver = self._driver_pools[headless].get_nowait()
+            self.logger.info("Reusing pooled ChromeDriver session")
+            return driver
+        except queue.Empty:
+            pass
         
         # Setup ChromeDriver with better error handling
         try:
             self.logger.info("Setting up ChromeDriver...")
+            self._start_service()
+            driver = self._new_session(headless)
+            self.logger.info("ChromeDriver setup successful")
+            return driver
+            
+        except Exception as e:
+            self.logger.error(f"Error setting up ChromeDriver: {str(e)}")
+            error_msg = f"""
+ChromeDriver setup failed: {str(e)}
+
+Solutions to try:
+1. Download ChromeDriver manually from https://chromedriver.chromium.org/
+2. Place chromedriver.exe in your project folder
+3. Add chromedriver.exe to your system PATH
+4. Make sure Chrome browser is installed and updated
+5. Run as Administrator if permission issues persist
+            """
+            raise Exception(error_msg)
+    
+    def _start_service(self) -> Service:
+        """Start the shared ChromeDriver service once per process."""
+        global _SERVICE, _DRIVER_PATH
+        
+        with _SERVICE_LOCK:
+            if _SERVICE is not None:
+                return _SERVICE
             
-            # Try multiple approaches to get ChromeDriver
-            driver_path = None
+            # Try multiple approaches to get ChromeDriver, unless already resolved
+            driver_path = _DRIVER_PATH
             
             # Approach 1: Try WebDriver Manager
-            try:
-                chrome_driver_manager = ChromeDriverManager()
-                driver_path = chrome_driver_manager.install()
-                
-                # Check if the downloaded file is actually chromedriver.exe
-                if not driver_path.endswith('.exe'):
-                    # Look for chromedriver.exe in the same directory
-                    import glob
-                    driver_dir = os.path.dirname(driver_path)
-                    chromedriver_files = glob.glob(os.path.join(driver_dir, '**/chromedriver.exe'), recursive=True)
-                    if chromedriver_files:
-                        driver_path = chromedriver_files[0]
+            if not driver_path:
+                try:
+                    chrome_driver_manager = ChromeDriverManager()
+                    driver_path = chrome_driver_manager.install()
+                    
+                    # Check if the downloaded file is actually chromedriver.exe
+                    if not driver_path.endswith('.exe'):
+                        # Look for chromedriver.exe in the same directory
+                        import glob
+                        driver_dir = os.path.dirname(driver_path)
+                        chromedriver_files = glob.glob(os.path.join(driver_dir, '**/chromedriver.exe'), recursive=True)
+                        if chromedriver_files:
+                            driver_path = chromedriver_files[0]
+                        else:
+                            driver_path = None
+                            
+                    if driver_path and os.path.exists(driver_path):
+                        self.logger.info(f"ChromeDriver found at: {driver_path}")
                     else:
                         driver_path = None
                         
-                if driver_path and os.path.exists(driver_path):
-                    self.logger.info(f"ChromeDriver found at: {driver_path}")
-                else:
+                except Exception as e1:
+                    self.logger.warning(f"WebDriver Manager failed: {str(e1)}")
                     driver_path = None
-                    
-            except Exception as e1:
-                self.logger.warning(f"WebDriver Manager failed: {str(e1)}")
-                driver_path = None
-            
+                
             # Approach 2: Try to find system ChromeDriver
             if not driver_path:
                 self.logger.info("Trying to find system ChromeDriver...")
@@ -119,34 +784,116 @@ class GoogleBusinessScraper:
                         self.logger.info(f"Found system ChromeDriver at: {path}")
                         break
             
-            # Approach 3: Try without specifying driver path (if in PATH)
-            if driver_path:
-                service = Service(driver_path)
-                driver = webdriver.Chrome(service=service, options=options)
-            else:
+            # Approach 3: Let Selenium Manager find chromedriver on the system PATH,
+            # or download one, as webdriver.Chrome() does without a driver path
+            if not driver_path:
                 self.logger.info("Trying ChromeDriver from system PATH...")
-                driver = webdriver.Chrome(options=options)
+                driver_path = DriverFinder.get_path(Service(), Options())
             
-            # Execute script to hide webdriver property
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
-            self.logger.info("ChromeDriver setup successful")
-            return driver
+            # Discard ChromeDriver's own log output
+            service = Service(driver_path, log_output=os.devnull)
+            service.start()
             
+            # Remembered only once it has started, so a failed lookup is retried next time
+            _DRIVER_PATH = driver_path
+            _SERVICE = service
+            return _SERVICE
+    
+    def _new_session(self, headless: bool) -> webdriver.Remote:
+        """Open a new browser session against the shared ChromeDriver service."""
+        options = Options()
+        
+        if headless:
+            options.add_argument('--headless')
+        
+        # Return from driver.get() once the DOM is interactive; explicit waits handle the rest
+        options.page_load_strategy = 'eager'
+        
+        # Chrome options for better performance and stealth
+        for arg in _CHROME_ARGS:
+            options.add_argument(arg)
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option('useAutomationExtension', False)
+        options.add_argument(f'--user-agent={self.ua.random}')
+        
+        # Remote debugging only on request; distinct port per process so parallel workers don't collide
+        debug_port = os.environ.get('CHROME_DEBUG_PORT')
+        if debug_port:
+            options.add_argument(f'--remote-debugging-port={int(debug_port) + os.getpid() % 1000}')
+        
+        # Only the DOM is scraped, so skip downloading and decoding images
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.media_stream": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
+        
+        # Chrome-flavoured connection so CDP commands are available on the remote session
+        executor = ChromiumRemoteConnection(_SERVICE.service_url, vendor_prefix='goog', browser_name='chrome')
+        driver = webdriver.Remote(command_executor=executor, options=options)
+        
+        # Block heavy static assets at the network layer
+        try:
+            self._execute_cdp(driver, 'Network.enable', {})
+            self._execute_cdp(driver, 'Network.setBlockedURLs', {'urls': _BLOCKED_URL_PATTERNS})
+            self._execute_cdp(driver, 'Network.setCacheDisabled', {'cacheDisabled': False})
         except Exception as e:
-            self.logger.error(f"Error setting up ChromeDriver: {str(e)}")
-            error_msg = f"""
-ChromeDriver setup failed: {str(e)}
-
-Solutions to try:
-1. Download ChromeDriver manually from https://chromedriver.chromium.org/
-2. Place chromedriver.exe in your project folder
-3. Add chromedriver.exe to your system PATH
-4. Make sure Chrome browser is installed and updated
-5. Run as Administrator if permission issues persist
-            """
-            raise Exception(error_msg)
+            self.logger.debug(f"Could not block static assets: {e}")
+        
+        # Execute script to hide webdriver property
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        
+        return driver
+    
+    @staticmethod
+    def _execute_cdp(driver, cmd: str, params: Dict) -> Dict:
+        """Run a Chrome DevTools Protocol command on a remote Chrome session."""
+        return driver.execute('executeCdpCommand', {'cmd': cmd, 'params': params})['value']
+    
+    def _reset_session(self, driver):
+        """Clear cookies and cache so a pooled session starts clean for its next owner."""
+        try:
+            driver.delete_all_cookies()
+            self._execute_cdp(driver, 'Network.clearBrowserCache', {})
+        except Exception as e:
+            self.logger.debug(f"Could not reset browser session: {e}")
     
+    def _release_driver(self, driver):
+        """Quit a WebDriver session, or return it to the pool when reuse_driver is set."""
+        if self.reuse_driver:
+            self._reset_session(driver)
+            try:
+                self._driver_pools[self.headless].put_nowait(driver)
+                self.logger.info("WebDriver returned to session pool")
+                return
+            except queue.Full:
+                pass
+        driver.quit()
+        self.logger.info("WebDriver closed")
+    
+    @classmethod
+    def close_pool(cls):
+        """Quit every pooled WebDriver session and stop the shared ChromeDriver service."""
+        global _SERVICE
+        
+        for pool in cls._driver_pools.values():
+            while True:
+                try:
+                    driver = pool.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+        
+        with _SERVICE_LOCK:
+            if _SERVICE is not None:
+                _SERVICE.stop()
+                _SERVICE = None
+    
+
     def search_businesses(self, query: str, location: str = "") -> List[Dict]:
         """
         Search for businesses on Google Maps and extract ALL data from search results.
@@ -160,27 +907,28 @@ Solutions to try:
             List[Dict]: List of business information dictionaries
         """
         search_query = f"{query} {location}".strip()
-        url = f"https://www.google.com/maps/search/{search_query.replace(' ', '+')}"
+        url = f"https://www.google.com/maps/search/{quote_plus(search_query)}"
         
         self.logger.info(f"Searching for: {search_query}")
         self.logger.info("Will scrape ALL available businesses using endless scrolling...")
         self.driver.get(url)
-        time.sleep(5)
         
         businesses = []
         
         try:
-            # Wait for search results to load
-            results_container = self._wait_for_results()
+            # Wait for search results to load, probing other containers only if needed
+            try:
+                results_container = self.wait.until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, '.hfpxzc, .m6QErb'))
+                )
+            except TimeoutException:
+                results_container = self._wait_for_results()
             if not results_container:
                 self.logger.error("Could not find search results container")
                 return businesses
             
-            # Scroll to load ALL results (endless scrolling)
-            self._scroll_and_load_all_results()
-            
-            # Extract business data from search results
-            businesses = self._extract_all_businesses_from_results()
+            # Scroll to load ALL results (endless scrolling), harvesting cards as they appear
+            businesses = self._scroll_and_extract()
             
             self.logger.info(f"Successfully scraped {len(businesses)} businesses")
             
@@ -208,8 +956,28 @@ Solutions to try:
         
         return None
     
-    def _scroll_and_load_all_results(self):
-        """Scroll the results panel to load ALL businesses using endless scrolling."""
+    def _count_cards(self) -> int:
+        """Count the result cards currently loaded without materialising WebElements."""
+        return self.driver.execute_script("return document.querySelectorAll('.hfpxzc').length")
+    
+    def _scroll_and_extract(self) -> List[Dict]:
+        """Scroll through all results, reading new cards while waiting for more to load."""
+        self._harvested_cards = []
+        self._scroll_and_load_all_results(on_scroll=self._harvest_new_cards)
+        return self._extract_all_businesses_from_results()
+    
+    def _harvest_new_cards(self):
+        """Read the result cards loaded since the previous harvest."""
+        self._harvested_cards.extend(self._bulk_extract_via_js(len(self._harvested_cards)))
+    
+    def _scroll_and_load_all_results(self, on_scroll=None):
+        """
+        Scroll the results panel to load ALL businesses using endless scrolling.
+        
+        Args:
+            on_scroll (callable): Optional callback run after each scroll, overlapping
+                its work with the wait for new results to load
+        """
         try:
             self.logger.info("Starting endless scrolling to load all businesses...")
             
@@ -219,12 +987,13 @@ Solutions to try:
             
             while consecutive_no_change < max_consecutive_no_change:
                 # Count current business elements before scrolling
-                current_businesses = self.driver.find_elements(By.CSS_SELECTOR, '.hfpxzc')
-                current_count = len(current_businesses)
+                current_count = self._count_cards()
                 
                 # Get the last business element to scroll to it
-                if current_businesses:
-                    last_business = current_businesses[-1]
+                if current_count:
+                    last_business = self.driver.execute_script(
+                        "const els = document.querySelectorAll('.hfpxzc'); return els[els.length - 1];"
+                    )
                     
                     try:
                         # Scroll to the last business element
@@ -237,9 +1006,9 @@ Solutions to try:
                         
                         # Also try scrolling within the results container
                         try:
-                            results_container = self.driver.find_element(By.CSS_SELECTOR, 'div[role="main"] .m6QErb')
-                            self.driver.execute_script("arguments[0].scrollTop += 1000;", results_container)
-                        except:
+                            for results_container in self.driver.find_elements(By.CSS_SELECTOR, 'div[role="main"] .m6QErb')[:1]:
+                                self.driver.execute_script("arguments[0].scrollTop += 1000;", results_container)
+                        except WebDriverException:
                             pass
                         
                         # Try clicking on the last business to trigger more loading
@@ -247,92 +1016,60 @@ Solutions to try:
                             self.driver.execute_script("arguments[0].click();", last_business)
                             time.sleep(1)
                             # Press escape to close any popup
-                            from selenium.webdriver.common.keys import Keys
-                            self.driver.find_element(By.TAG_NAME, 'body').send_keys(Keys.ESCAPE)
+                            self.driver.execute_script(_ESCAPE_JS)
                             time.sleep(1)
-                        except:
+                        except WebDriverException:
                             pass
                             
                     except Exception as e:
                         self.logger.debug(f"Error in scrolling approach: {e}")
                 
-                # Wait for content to load (reduced for faster scrolling)
-                time.sleep(2.5)
+                # Wait for content to load (reduced for faster scrolling), doing
+                # the caller's work during the wait instead of after it
+                wait_start = time.time()
+                if on_scroll:
+                    try:
+                        on_scroll()
+                    except Exception as e:
+                        self.logger.debug(f"Error in scroll callback: {e}")
+                time.sleep(max(0.0, 2.5 - (time.time() - wait_start)))
                 
-                # Check for a "Show more results" or similar button
+                # Check for a "Show more results" or similar button; the lookup,
+                # visibility check and click are one script call
                 try:
-                    more_results_selectors = [
-                        'button[data-value="See more results"]',
-                        'button:contains("more")',
-                        '.more-results',
-                        '[aria-label*="more"]',
-                        'button[jsaction*="more"]'
-                    ]
-                    
-                    for selector in more_results_selectors:
-                        try:
-                            more_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                            if more_button and more_button.is_displayed():
-                                self.driver.execute_script("arguments[0].click();", more_button)
-                                self.logger.info("Clicked 'Show more results' button")
-                                time.sleep(2)  # Reduced wait time after clicking
-                                break
-                        except:
-                            continue
-                except:
+                    if self.driver.execute_script(_CLICK_MORE_RESULTS_JS, _MORE_RESULTS_SELECTORS):
+                        self.logger.info("Clicked 'Show more results' button")
+                        time.sleep(2)  # Reduced wait time after clicking
+                except WebDriverException:
                     pass
                 
                 # Check for "end of list" message to stop scraping
                 try:
-                    end_of_list_messages = [
-                        "You've reached the end of the list.",
-                        "You've reached the end",
-                        "No more results",
-                        "End of results",
-                        "That's all we found",
-                        "No more places to show"
-                    ]
-                    
-                    # Check for end of list indicators
-                    page_text = self.driver.page_source.lower()
-                    for end_message in end_of_list_messages:
-                        if end_message.lower() in page_text:
-                            self.logger.info(f"Found end of list message: '{end_message}' - Stopping scraping")
-                            final_count = len(self.driver.find_elements(By.CSS_SELECTOR, '.hfpxzc'))
-                            self.logger.info(f"Scraping completed successfully. Total businesses found: {final_count}")
-                            return
+                    # Check for end of list indicators in the results tail only
+                    end_message = self.driver.execute_script(_END_OF_LIST_JS, list(_END_OF_LIST_MESSAGES))
+                    if end_message:
+                        self.logger.info(f"Found end of list message: '{end_message}' - Stopping scraping")
+                        final_count = self._count_cards()
+                        self.logger.info(f"Scraping completed successfully. Total businesses found: {final_count}")
+                        return
                     
                     # Also check for visible end-of-list elements
-                    end_selectors = [
-                        '[data-value*="end"]',
-                        '[aria-label*="end"]',
-                        '.section-no-result',
-                        '.no-more-results',
-                        '*:contains("end of the list")',
-                        '*:contains("no more results")'
-                    ]
-                    
-                    for selector in end_selectors:
+                    for element in self.driver.find_elements(By.CSS_SELECTOR, _END_OF_LIST_CSS):
                         try:
-                            end_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                            for element in end_elements:
-                                if element.is_displayed() and element.text:
-                                    element_text = element.text.lower()
-                                    for end_message in end_of_list_messages:
-                                        if end_message.lower() in element_text:
-                                            self.logger.info(f"Found end of list element: '{element.text}' - Stopping scraping")
-                                            final_count = len(self.driver.find_elements(By.CSS_SELECTOR, '.hfpxzc'))
-                                            self.logger.info(f"Scraping completed successfully. Total businesses found: {final_count}")
-                                            return
-                        except:
+                            element_text = element.text
+                            if element_text and element.is_displayed() and _END_OF_LIST_RE.search(element_text):
+                                self.logger.info(f"Found end of list element: '{element_text}' - Stopping scraping")
+                                final_count = self._count_cards()
+                                self.logger.info(f"Scraping completed successfully. Total businesses found: {final_count}")
+                                return
+                        except WebDriverException:
                             continue
                             
                 except Exception as e:
                     self.logger.debug(f"Error checking for end of list: {e}")
                 
                 # Count business elements after scrolling
-                new_businesses = self.driver.find_elements(By.CSS_SELECTOR, '.hfpxzc')
-                new_count = len(new_businesses)
+                new_count = self._count_cards()
                 
                 scrolls += 1
                 
@@ -351,12 +1088,11 @@ Solutions to try:
                         # Additional check for end-of-list indicators when no new results
                         try:
                             # Check if there are any "Show more" buttons still available
-                            more_buttons = self.driver.find_elements(By.CSS_SELECTOR, 'button[data-value="See more results"]')
-                            available_buttons = [btn for btn in more_buttons if btn.is_displayed() and btn.is_enabled()]
+                            more_available = self.driver.execute_script(_MORE_RESULTS_AVAILABLE_JS)
                             
-                            if not available_buttons:
+                            if not more_available:
                                 self.logger.info("No more 'Show more results' buttons available - reached end of results")
-                                final_count = len(self.driver.find_elements(By.CSS_SELECTOR, '.hfpxzc'))
+                                final_count = self._count_cards()
                                 self.logger.info(f"Scraping completed successfully. Total businesses found: {final_count}")
                                 break
                                 
@@ -368,396 +1104,347 @@ Solutions to try:
                     self.logger.info("Reached maximum scroll limit (50 scrolls)")
                     break
                     
-            final_count = len(self.driver.find_elements(By.CSS_SELECTOR, '.hfpxzc'))
+            final_count = self._count_cards()
             self.logger.info(f"Scrolling completed after {scrolls} scrolls. Total businesses loaded: {final_count}")
                 
         except Exception as e:
             self.logger.warning(f"Error scrolling results: {str(e)}")
     
-    def _extract_all_businesses_from_results(self) -> List[Dict]:
-        """Extract ALL business data directly from search results with memory-efficient batching."""
+    def _bulk_extract_via_js(self, start: int = 0) -> List[Dict]:
+        """Extract the data visible on every result card from index `start` with a single script call."""
         businesses = []
         
+        try:
+            cards = self.driver.execute_script(_CARDS_JS, start) or []
+        except WebDriverException as e:
+            self.logger.debug(f"Bulk card extraction failed: {e}")
+            return businesses
+        
+        for card in cards:
+            business_data = {}
+            if card.get('name'):
+                business_data['name'] = card['name'].strip()
+            if card.get('href'):
+                business_data['website'] = card['href']
+            
+            rating = (card.get('rating') or '').replace(',', '.')
+            try:
+                if rating and 0 <= float(rating) <= 5:
+                    business_data['rating'] = rating
+            except ValueError:
+                pass
+            
+            reviews = (card.get('reviews') or '').strip('() ').replace(',', '')
+            if reviews.isdigit():
+                business_data['reviews_count'] = reviews
+            
+            for field in ('category', 'address'):
+                text = (card.get(field) or '').strip(' ·')
+                if text:
+                    business_data[field] = text
+            
+            businesses.append(business_data)
+        
+        return businesses
+    
+    def _extract_all_businesses_from_results(self) -> List[Dict]:
+        """Extract ALL business data directly from search results, one card position at a time."""
+        # Unique businesses in result order; sidebar batches patch these dicts in place
+        rows = []
+        
         try:
             self.logger.info("Starting business data extraction...")
             
-            # Use the most reliable selector
-            primary_selector = '.hfpxzc'
+            # Track extracted businesses to avoid duplicates (lower-cased names)
+            seen_names = set()
             
-            # Track extracted businesses to avoid duplicates
-            seen_business_names = set()
+            # Cards already read while scrolling
+            card_data = list(self._harvested_cards)
             
-            # Process businesses in smaller batches to prevent memory issues
-            batch_size = 20  # Process 20 businesses at a time
-            processed_count = 0
+            # Card positions still needing the sidebar, with their business in rows
+            pending = {}
             
-            while True:
-                # Re-find elements each batch to avoid stale references
-                business_elements = self.driver.find_elements(By.CSS_SELECTOR, primary_selector)
-                
-                # Check if we've processed all available elements
-                if processed_count >= len(business_elements):
-                    self.logger.info(f"Processed all {len(business_elements)} available business elements")
-                    break
-                
-                # Get the next batch
-                batch_start = processed_count
-                batch_end = min(processed_count + batch_size, len(business_elements))
-                current_batch = business_elements[batch_start:batch_end]
-                
-                self.logger.info(f"Processing batch {batch_start + 1}-{batch_end} of {len(business_elements)} total elements")
+            # Result cards are append-only, so track a position rather than holding
+            # WebElements that go stale between iterations
+            next_idx = 0
+            total = self._count_cards()
+            self.logger.info(f"Processing {total} business elements")
+            
+            while next_idx < total:
+                # Read any cards not harvested during scrolling in one round-trip
+                if next_idx >= len(card_data):
+                    card_data.extend(self._bulk_extract_via_js(len(card_data)))
                 
-                # Process each element in the current batch
-                for i, element in enumerate(current_batch):
-                    try:
-                        # Extract basic data first (faster and more reliable)
-                        basic_data = self._extract_basic_data_from_element(element, len(businesses) + 1)
+                try:
+                    card = card_data[next_idx] if next_idx < len(card_data) else {}
+                    card_complete = all(card.get(field) for field in _REQUIRED_FIELDS)
+                    
+                    # The card's aria-label is already known, so duplicates are
+                    # skipped before any extraction or click
+                    card_name = (card.get('name') or '').strip().lower()
+                    if card_name and card_name in seen_names:
+                        self.logger.debug(f"[SKIP] Duplicate business: {card.get('name')}")
+                        continue
+                    
+                    # Reuse businesses already extracted in an earlier search
+                    cached = self._extract_cache.get(card.get('website', ''))
+                    
+                    # Only fall back to per-element extraction for incomplete cards
+                    if cached:
+                        basic_data = dict(cached)
+                        card_complete = all(basic_data.get(field) for field in _REQUIRED_FIELDS)
+                    elif card_complete:
+                        basic_data = dict(card)
+                    else:
+                        element = self.driver.execute_script(_CARD_AT_JS, next_idx)
+                        basic_data = self._extract_basic_data_from_element(element, len(rows) + 1) if element else {}
+                        for key, value in card.items():
+                            if value and not basic_data.get(key):
+                                basic_data[key] = value
+                    
+                    if basic_data and basic_data.get('name'):
+                        business_name = basic_data.get('name', '').strip().lower()
                         
-                        if basic_data and basic_data.get('name'):
-                            business_name = basic_data.get('name', '').strip().lower()
+                        # Check for duplicates
+                        if business_name and business_name not in seen_names:
+                            seen_names.add(business_name)
+                            if card_name:
+                                seen_names.add(card_name)
                             
-                            # Check for duplicates
-                            if business_name and business_name not in seen_business_names:
-                                
-                                # Try to get additional data by clicking (with extended timing for complete data loading)
-                                try:
-                                    # Scroll element into view
-                                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                                    time.sleep(0.5)  # Wait for scroll to complete
-                                    
-                                    # Try clicking for detailed info
-                                    element.click()
-                                    time.sleep(5.0)  # Wait 5 seconds as requested by user for complete popup loading
-                                    
-                                    # Wait for sidebar content to fully load with extended timeout
-                                    try:
-                                        # Wait for sidebar to be present and stable
-                                        WebDriverWait(self.driver, 5).until(
-                                            EC.presence_of_element_located((By.CSS_SELECTOR, "[data-value='Directions'], .TIHn2, .m6QErb"))
-                                        )
-                                        time.sleep(2.0)  # Extended wait for all content to render completely
-                                    except TimeoutException:
-                                        # If sidebar doesn't load normally, still wait extended time
-                                        time.sleep(3.0)
-                                    
-                                    # Try to extract additional data from sidebar
-                                    detailed_data = self._extract_quick_sidebar_data()
-                                    if detailed_data:
-                                        # Merge with basic data
-                                        for key, value in detailed_data.items():
-                                            if value and (key not in basic_data or not basic_data[key]):
-                                                basic_data[key] = value
-                                                
-                                except Exception as click_error:
-                                    self.logger.debug(f"Click failed for {business_name}: {str(click_error)[:50]}...")
-                                
-                                # Add required fields
-                                required_fields = ['rating', 'reviews_count', 'category', 'address', 'phone', 'website', 'business_website_url', 'hours', 'price_range', 'description']
-                                for field in required_fields:
-                                    if field not in basic_data:
-                                        basic_data[field] = ""
-                                
-                                basic_data['index'] = len(businesses) + 1
-                                businesses.append(basic_data)
-                                seen_business_names.add(business_name)
-                                
-                                self.logger.info(f"[{len(businesses)}] Extracted: {basic_data.get('name')} - Rating: {basic_data.get('rating', 'N/A')} - Category: {basic_data.get('category', 'N/A')}")
-                                
-                            else:
-                                self.logger.debug(f"[SKIP] Duplicate business: {basic_data.get('name')}")
+                            # Complete cards (or list-only mode) skip the sidebar entirely
+                            if not card_complete and self.detail_fields_needed:
+                                pending[next_idx] = basic_data
+                            rows.append(basic_data)
                         else:
-                            self.logger.debug(f"[SKIP] No valid name from element {batch_start + i + 1}")
-                            
-                    except Exception as e:
-                        self.logger.debug(f"[ERROR] Failed to extract from element {batch_start + i + 1}: {str(e)[:50]}...")
-                        continue
-                
-                processed_count = batch_end
+                            self.logger.debug(f"[SKIP] Duplicate business: {basic_data.get('name')}")
+                    else:
+                        self.logger.debug(f"[SKIP] No valid name from element {next_idx + 1}")
+                        
+                except Exception as e:
+                    self.logger.debug(f"[ERROR] Failed to extract from element {next_idx + 1}: {str(e)[:50]}...")
                 
-                # Memory cleanup every batch
-                if len(businesses) % 50 == 0 and len(businesses) > 0:
-                    self.logger.info(f"Extracted {len(businesses)} businesses so far...")
+                finally:
+                    next_idx += 1
+                    
+                    # Pick up any cards that loaded while reading the list
+                    if next_idx >= total:
+                        total = self._count_cards()
+            
+            # Open the sidebar for incomplete cards, a whole batch per script call
+            if pending:
+                self.logger.info(f"Reading sidebar details for {len(pending)} incomplete businesses")
+                self._merge_sidebar_data(pending)
+            
+            for index, basic_data in enumerate(rows, 1):
+                # Every field present, empty where nothing was found
+                for field in _BUSINESS_FIELDS:
+                    basic_data.setdefault(field, "")
+                basic_data['index'] = index
+                # Only complete records are cached, as copies so later edits don't leak in
+                key = basic_data['website']
+                if '/maps/place/' in key and all(basic_data[field] for field in _REQUIRED_FIELDS):
+                    self._extract_cache[key] = dict(basic_data)
                 
-                # Small delay between batches to prevent overloading
-                time.sleep(0.5)
+                self.logger.info(f"[{index}] Extracted: {basic_data.get('name')} - Rating: {basic_data.get('rating', 'N/A')} - Category: {basic_data.get('category', 'N/A')}")
                 
         except Exception as e:
             self.logger.error(f"Error in business extraction process: {str(e)}")
         
-        self.logger.info(f"Total businesses extracted: {len(businesses)}")
-        return businesses
+        self.logger.info(f"Total businesses extracted: {len(rows)}")
+        return rows
     
-    def _extract_quick_sidebar_data(self) -> Optional[Dict]:
-        """Extract comprehensive data from sidebar with extended wait for complete loading."""
-        try:
-            data = {}
-            
-            # Extended wait for sidebar content to stabilize completely
-            time.sleep(1.0)  # Additional stabilization time
+    def _merge_sidebar_data(self, pending: Dict[int, Dict]):
+        """Fill missing fields of the pending businesses (keyed by card position) from their sidebars."""
+        positions = list(pending)
+        
+        # Open place pages on parallel sessions when configured; cards without a
+        # place link still go through the main browser below
+        if self.detail_workers > 0:
+            urls = {position: pending[position].get('website', '') for position in positions}
+            urls = {position: url for position, url in urls.items() if '/maps/place/' in url}
+            if urls:
+                for position, details in self._parallel_sidebar_extract(urls).items():
+                    basic_data = pending[position]
+                    for key, value in details.items():
+                        if value and not basic_data.get(key):
+                            basic_data[key] = value
+                positions = [position for position in positions if position not in urls]
+        
+        for batch_start in range(0, len(positions), _SIDEBAR_BATCH_SIZE):
+            batch = positions[batch_start:batch_start + _SIDEBAR_BATCH_SIZE]
             
-            # Quick rating extraction with multiple selectors
             try:
-                rating_selectors = [
-                    '.F7nice span[aria-label*="stars"]',
-                    '.F7nice .fontBodyMedium',
-                    '[data-value] span',
-                    '.aMPvhf-fI6EEc-KVuj8d',
-                    'span[role="img"][aria-label*="stars"]'
-                ]
-                
-                for selector in rating_selectors:
-                    try:
-                        rating_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        rating_text = rating_element.text or rating_element.get_attribute('aria-label') or ""
-                        rating_match = re.search(r'(\d+\.?\d*)', rating_text)
-                        if rating_match:
-                            rating = rating_match.group(1)
-                            if 0 <= float(rating) <= 5:
-                                data['rating'] = rating
-                                break
-                    except:
-                        continue
-            except:
-                pass
+                detailed = self._batch_sidebar_extract(batch)
+            except (TimeoutException, WebDriverException) as e:
+                # Fall back to clicking one card at a time
+                self.logger.debug(f"Batched sidebar extraction failed: {str(e)[:80]}")
+                detailed = {}
+                for position in batch:
+                    detailed[position] = self._click_for_sidebar_data(position)
             
-            # Enhanced reviews count extraction with better parsing
-            try:
-                reviews_selectors = [
-                    '.F7nice span[aria-label*="reviews"]',
-                    '.F7nice span[aria-label*="review"]',
-                    '.UY7F9',
-                    'button[aria-label*="reviews"]',
-                    'span[aria-label*="review"]'
-                ]
-                
-                for selector in reviews_selectors:
-                    try:
-                        reviews_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        reviews_text = reviews_element.text or reviews_element.get_attribute('aria-label') or ""
-                        # Look for numbers in parentheses, standalone numbers, or comma-separated numbers
-                        count_match = re.search(r'[\(\s](\d+,?\d*)[\)\s]|(\d+,?\d+)\s*review|(\d+,?\d+)', reviews_text)
-                        if count_match:
-                            count = count_match.group(1) or count_match.group(2) or count_match.group(3)
-                            data['reviews_count'] = count.replace(',', '')
-                            break
-                    except:
-                        continue
-            except:
-                pass
+            for position in batch:
+                basic_data = pending[position]
+                for key, value in (detailed.get(position) or {}).items():
+                    if value and not basic_data.get(key):
+                        basic_data[key] = value
+    
+    def extract_places(self, urls: List[str], workers: int = 4) -> List[Dict]:
+        """
+        Extract the sidebar data of several business pages in parallel.
+        
+        Args:
+            urls (List[str]): Google Maps place URLs
+            workers (int): Browser sessions opened for the pages, each used by one
+                thread at a time
             
-            # Enhanced category extraction with comprehensive approaches
-            try:
-                category_selectors = [
-                    'button[jsaction*="category"]',
-                    '.DkEaL',
-                    'button.DkEaL',
-                    '.LBgpqf',
-                    '[data-value="Categories"] + div',
-                    'button[data-value*="category"]',
-                    '.skqShb'
-                ]
-                
-                for selector in category_selectors:
-                    try:
-                        category_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        category_text = category_element.text.strip()
-                        if category_text and 'directions' not in category_text.lower() and len(category_text) < 100:
-                            data['category'] = category_text
-                            break
-                    except:
-                        continue
-                        
-                # Enhanced text parsing with longer wait time benefits
-                if 'category' not in data:
-                    try:
-                        # Look for category patterns in the sidebar area specifically
-                        sidebar_elements = self.driver.find_elements(By.CSS_SELECTOR, '.TIHn2, .m6QErb, [role="main"]')
-                        for sidebar in sidebar_elements:
-                            text_content = sidebar.text
-                            lines = text_content.split('\n')
-                            for line in lines[:30]:  # Check more lines with extended time
-                                line = line.strip()
-                                if any(cat_word in line.lower() for cat_word in ['restaurant', 'cafe', 'bar', 'grill', 'kitchen', 'diner', 'bistro', 'steakhouse', 'pizzeria', 'bakery']):
-                                    if len(line) < 50 and line not in ['Restaurant', 'Restaurants'] and '·' not in line:
-                                        data['category'] = line
-                                        break
-                            if 'category' in data:
-                                break
-                    except:
-                        pass
-            except:
-                pass
+        Returns:
+            List[Dict]: Business data for each URL, in input order ({} where a page failed)
+        """
+        if not urls:
+            return []
+        pool = BrowserPool(self, max(1, min(workers, len(urls))))
+        try:
+            return pool.map(self._extract_place_details, urls)
+        finally:
+            pool.close()
+    
+    def _parallel_sidebar_extract(self, urls: Dict[int, str]) -> Dict[int, Dict]:
+        """Open each place URL on a pool of browser sessions and read its sidebar."""
+        return dict(zip(urls, self.extract_places(list(urls.values()), self.detail_workers)))
+    
+    def _extract_place_details(self, driver, url: str) -> Dict:
+        """Load a business page on the given session and extract its sidebar data."""
+        try:
+            driver.get(url)
+            WebDriverWait(driver, self.timeout, poll_frequency=0.1).until(
+                lambda d: d.execute_script(_SIDEBAR_LOADED_JS, _SIDEBAR_LOADED_SELECTORS, _SIDEBAR_TITLE_SELECTORS)
+            )
+            return self._extract_detailed_data_from_sidebar(driver)
+        except Exception as e:
+            self.logger.debug(f"Could not load business page {url[:80]}: {str(e)[:80]}")
+            return {}
+    
+    def _batch_sidebar_extract(self, positions: List[int]) -> Dict[int, Dict]:
+        """
+        Click each card in turn inside the browser and harvest its sidebar.
+        
+        The whole click -> wait -> read cycle runs in one asynchronous script,
+        replacing several WebDriver round-trips per business with one per batch.
+        """
+        previous_timeout = self.driver.timeouts.script
+        self.driver.set_script_timeout(len(positions) * (_SIDEBAR_WAIT_MS + _SIDEBAR_ROWS_WAIT_MS) / 1000 + 10)
+        try:
+            results = self.driver.execute_async_script(
+                _SIDEBAR_BATCH_JS, positions, _QUICK_SIDEBAR_SELECTORS, _SIDEBAR_DETAIL_ROWS,
+                _SIDEBAR_WAIT_MS, _SIDEBAR_ROWS_WAIT_MS
+            )
+        finally:
+            self.driver.set_script_timeout(previous_timeout)
+        
+        # Surfaced as a WebDriverException so the caller falls back to single clicks
+        if isinstance(results, dict):
+            raise WebDriverException(f"Sidebar batch script failed: {results.get('error')}")
+        
+        return {result['index']: self._read_quick_hits(result['hits']) for result in results or []}
+    
+    def _click_for_sidebar_data(self, position: int) -> Dict:
+        """Click a single card from Python and read its sidebar."""
+        try:
+            element = self.driver.execute_script(_CARD_AT_JS, position)
+            if not element:
+                return {}
             
-            # Enhanced address extraction with more comprehensive selectors
+            # Click for detailed info and wait until the sidebar shows this business
+            previous_title = self.driver.execute_script(_SIDEBAR_TITLE_JS)
+            self.driver.execute_script(_SCROLL_AND_CLICK_JS, element)
             try:
-                address_selectors = [
-                    'button[data-item-id="address"] .Io6YTe',
-                    'button[aria-label*="Address"]',
-                    '.Io6YTe',
-                    '.LrzXr',
-                    'button[data-item-id="address"]',
-                    '[data-item-id="address"]'
-                ]
-                
-                for selector in address_selectors:
-                    try:
-                        address_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        address_text = address_element.text.strip() or address_element.get_attribute('aria-label')
-                        if address_text:
-                            if 'Address:' in address_text:
-                                address_clean = address_text.replace('Address:', '').strip()
-                                if len(address_clean) > 10:
-                                    data['address'] = address_clean
-                                    break
-                            elif any(addr_word in address_text.lower() for addr_word in ['street', 'st ', ' st', 'ave', 'avenue', 'ny ', 'new york', 'broadway', 'road', 'rd']) and len(address_text) > 10:
-                                data['address'] = address_text
-                                break
-                    except:
-                        continue
-            except:
-                pass
+                WebDriverWait(self.driver, 4, poll_frequency=0.1).until(
+                    lambda d: d.execute_script(_SIDEBAR_TITLE_JS) not in (None, previous_title)
+                )
+            except TimeoutException:
+                self.logger.debug(f"Sidebar did not change for element {position + 1}")
             
-            # Enhanced phone extraction with extended selectors
-            try:
-                phone_selectors = [
-                    'button[data-item-id*="phone"] .Io6YTe',
-                    'button[aria-label*="Phone"]',
-                    'button[aria-label*="Call"]',
-                    '[data-item-id="phone"]',
-                    'button[data-item-id="phone"]'
-                ]
-                
-                for selector in phone_selectors:
-                    try:
-                        phone_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        phone_text = phone_element.text.strip() or phone_element.get_attribute('aria-label')
-                        if phone_text:
-                            if 'Phone:' in phone_text:
-                                phone_clean = phone_text.replace('Phone:', '').strip()
-                                if self._is_valid_phone(phone_clean):
-                                    data['phone'] = phone_clean
-                                    break
-                            elif self._is_valid_phone(phone_text):
-                                data['phone'] = phone_text
-                                break
-                    except:
-                        continue
-            except:
-                pass
+            return self._extract_quick_sidebar_data() or {}
             
-            # Enhanced website extraction with focus on actual business websites
-            try:
-                website_selectors = [
-                    'button[data-item-id*="website"] .Io6YTe',
-                    'button[aria-label*="Website"]',
-                    'button[data-item-id="website"]',
-                    '[data-item-id="website"]',
-                    'button[data-item-id="website"] span',
-                    'a[href*="http"]',
-                    'button[aria-label*="website"]'
-                ]
-                
-                for selector in website_selectors:
-                    try:
-                        website_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        website_text = website_element.text.strip() or website_element.get_attribute('href') or website_element.get_attribute('aria-label')
-                        
-                        if website_text:
-                            # Clean up website text
-                            if 'Website:' in website_text:
-                                website_text = website_text.replace('Website:', '').strip()
-                            
-                            # Store Google Maps URL as website
-                            if ('http' in website_text or '.com' in website_text or '.org' in website_text or '.net' in website_text):
-                                data['website'] = website_text
-                                break
-                    except:
-                        continue
-                        
-                # Extract business website URL from the specific HTML structure provided
+        except Exception as click_error:
+            self.logger.debug(f"Click failed for element {position + 1}: {str(click_error)[:50]}...")
+            return {}
+    
+    def _first_matches(self, selectors_by_field: Dict[str, Tuple[str, ...]]) -> Dict[str, List[Dict]]:
+        """
+        Resolve the selector cascades of several fields in a single script call.
+        
+        Returns, per field, the first element matched by each selector, in selector order,
+        as dicts with 'text', 'aria', 'href' and 'inner' keys. Selectors without a match are skipped.
+        """
+        try:
+            return self.driver.execute_script(_SIDEBAR_JS, selectors_by_field) or {}
+        except WebDriverException as e:
+            self.logger.debug(f"Selector batch failed: {e}")
+            return {}
+    
+    def _extract_quick_sidebar_data(self) -> Optional[Dict]:
+        """Extract comprehensive data from sidebar with extended wait for complete loading."""
+        try:
+            # Candidates for every field in one round-trip, then the first
+            # candidate each field's reader accepts
+            data = self._read_quick_hits(self._first_matches(_QUICK_SIDEBAR_SELECTORS))
+            
+            # Enhanced text parsing with longer wait time benefits
+            if 'category' not in data:
                 try:
-                    # Look for the specific structure: .AeaXub .rogA2c .gSkmPd containing the business website
-                    business_website_elements = self.driver.find_elements(By.CSS_SELECTOR, '.AeaXub .rogA2c .gSkmPd.fontBodySmall.DshQNd')
-                    for elem in business_website_elements:
-                        website_text = elem.text.strip()
-                        if website_text and ('.com' in website_text or '.org' in website_text or '.net' in website_text or '.edu' in website_text):
-                            # Validate it's a business website (not Google)
-                            if 'google.com' not in website_text and 'maps' not in website_text:
-                                data['business_website_url'] = website_text
-                                break
-                    
-                    # Alternative selector for business website
-                    if 'business_website_url' not in data:
-                        alt_selectors = [
-                            '.gSkmPd.fontBodySmall.DshQNd',
-                            '.rogA2c .gSkmPd',
-                            '.Io6YTe + .HMy2Jf + .gSkmPd'
-                        ]
-                        for selector in alt_selectors:
-                            try:
-                                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                                for elem in elements:
-                                    text = elem.text.strip()
-                                    if text and any(domain in text for domain in ['.com', '.org', '.net', '.edu']) and 'google.com' not in text:
-                                        data['business_website_url'] = text
-                                        break
-                                if 'business_website_url' in data:
+                    # Look for category patterns in the sidebar area specifically
+                    sidebar_elements = self.driver.find_elements(By.CSS_SELECTOR, '.TIHn2, .m6QErb, [role="main"]')
+                    for sidebar in sidebar_elements:
+                        text_content = sidebar.text
+                        lines = text_content.splitlines()
+                        for line in lines[:30]:  # Check more lines with extended time
+                            line = line.strip()
+                            if _SIDEBAR_CATEGORY_RE.search(line):
+                                if len(line) < 50 and line not in ['Restaurant', 'Restaurants'] and '·' not in line:
+                                    data['category'] = line
                                     break
-                            except:
-                                continue
-                except:
+                        if 'category' in data:
+                            break
+                except WebDriverException:
                     pass
-                        
-                # If no website found with selectors, try to find website links in the sidebar text
-                if 'website' not in data:
-                    try:
-                        sidebar_elements = self.driver.find_elements(By.CSS_SELECTOR, '.TIHn2, .m6QErb, [role="main"]')
-                        for sidebar in sidebar_elements:
-                            # Look for clickable website elements
-                            website_links = sidebar.find_elements(By.CSS_SELECTOR, 'a[href*="http"]')
-                            for link in website_links:
-                                href = link.get_attribute('href')
-                                if href:
-                                    data['website'] = href
-                                    break
-                            if 'website' in data:
-                                break
-                                
-                            # Also check for website buttons that might contain the URL
-                            website_buttons = sidebar.find_elements(By.CSS_SELECTOR, 'button[data-item-id*="website"], button[aria-label*="Website"]')
-                            for button in website_buttons:
-                                button_text = button.text.strip()
-                                if button_text and any(domain in button_text for domain in ['.com', '.org', '.net', '.edu', '.gov']):
-                                    data['website'] = button_text
-                                    break
-                            if 'website' in data:
-                                break
-                    except:
-                        pass
-            except:
-                pass
             
-            # Enhanced hours extraction with extended wait benefits
+            # Extract business website URL from the .gSkmPd structure, all candidates in one call
             try:
-                hours_selectors = [
-                    'button[data-item-id*="hours"]',
-                    'button[aria-label*="Hours"]',
-                    '[data-item-id="hours"]',
-                    '.t39EBf'
-                ]
-                
-                for selector in hours_selectors:
-                    try:
-                        hours_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        hours_text = hours_element.text.strip() or hours_element.get_attribute('aria-label')
-                        if hours_text and any(time_word in hours_text.lower() for time_word in ['am', 'pm', 'open', 'closed', 'hours']):
-                            if len(hours_text) < 200:  # Reasonable hours length
-                                data['hours'] = hours_text
-                                break
-                    except:
-                        continue
-            except:
+                website_url = _extract_business_website(
+                    self.driver.execute_script(_TEXTS_JS, _BUSINESS_WEBSITE_SELECTORS) or []
+                )
+                if website_url:
+                    data['business_website_url'] = website_url
+            except WebDriverException:
                 pass
+                    
+            # If no website found with selectors, try to find website links in the sidebar text
+            if 'website' not in data:
+                try:
+                    sidebar_elements = self.driver.find_elements(By.CSS_SELECTOR, '.TIHn2, .m6QErb, [role="main"]')
+                    for sidebar in sidebar_elements:
+                        # Look for clickable website elements
+                        website_links = sidebar.find_elements(By.CSS_SELECTOR, 'a[href*="http"]')
+                        for link in website_links:
+                            href = link.get_attribute('href')
+                            if href:
+                                data['website'] = href
+                                break
+                        if 'website' in data:
+                            break
+                            
+                        # Also check for website buttons that might contain the URL
+                        website_buttons = sidebar.find_elements(By.CSS_SELECTOR, 'button[data-item-id*="website"], button[aria-label*="Website"]')
+                        for button in website_buttons:
+                            button_text = button.text.strip()
+                            if button_text and _BUTTON_DOMAIN_RE.search(button_text):
+                                data['website'] = button_text
+                                break
+                        if 'website' in data:
+                            break
+                except WebDriverException:
+                    pass
             
             return data if data else None
             
@@ -765,67 +1452,156 @@ Solutions to try:
             self.logger.debug(f"Enhanced sidebar extraction failed: {e}")
             return None
     
+    def _read_quick_hits(self, hits: Dict[str, List[Dict]]) -> Dict:
+        """The first candidate each field's reader accepts, from _QUICK_SIDEBAR_SELECTORS hits."""
+        data = {}
+        readers = (
+            ('rating', self._read_quick_rating),
+            ('reviews_count', self._read_quick_reviews_count),
+            ('category', self._read_quick_category),
+            ('address', self._read_quick_address),
+            ('phone', self._read_quick_phone),
+            ('website', self._read_quick_website),
+            ('hours', self._read_quick_hours)
+        )
+        for field, read in readers:
+            for hit in hits.get(field, []):
+                value = read(hit)
+                if value:
+                    data[field] = value
+                    break
+        return data
+    
+    def _read_quick_rating(self, hit: Dict) -> str:
+        """Rating from a sidebar candidate, if it holds one between 0 and 5."""
+        rating_match = _RATING_RE.search(hit['text'] or hit['aria'] or "")
+        if rating_match:
+            rating = rating_match.group(1)
+            try:
+                if 0 <= float(rating) <= 5:
+                    return rating
+            except ValueError:
+                pass
+        return ""
+    
+    def _read_quick_reviews_count(self, hit: Dict) -> str:
+        """Review count from a sidebar candidate."""
+        # Look for numbers in parentheses, standalone numbers, or comma-separated numbers
+        count_match = _REVIEWS_RE.search(hit['text'] or hit['aria'] or "")
+        if count_match:
+            count = count_match.group(1) or count_match.group(2) or count_match.group(3)
+            return count.replace(',', '')
+        return ""
+    
+    def _read_quick_category(self, hit: Dict) -> str:
+        """Category from a sidebar candidate."""
+        category_text = hit['text']
+        if category_text and 'directions' not in category_text.lower() and len(category_text) < 100:
+            return category_text
+        return ""
+    
+    def _read_quick_address(self, hit: Dict) -> str:
+        """Address from a sidebar candidate's text or aria-label."""
+        address_text = hit['text'] or hit['aria']
+        if address_text:
+            if 'Address:' in address_text:
+                address_clean = address_text.replace('Address:', '').strip()
+                if len(address_clean) > 10:
+                    return address_clean
+            elif len(address_text) > 10:
+                address_low = address_text.lower()
+                if any(addr_word in address_low for addr_word in ['street', 'st ', ' st', 'ave', 'avenue', 'ny ', 'new york', 'broadway', 'road', 'rd']):
+                    return address_text
+        return ""
+    
+    def _read_quick_phone(self, hit: Dict) -> str:
+        """Phone number from a sidebar candidate's text or aria-label."""
+        phone_text = hit['text'] or hit['aria']
+        if phone_text:
+            if 'Phone:' in phone_text:
+                phone_clean = phone_text.replace('Phone:', '').strip()
+                if self._is_valid_phone(phone_clean):
+                    return phone_clean
+            elif self._is_valid_phone(phone_text):
+                return phone_text
+        return ""
+    
+    def _read_quick_website(self, hit: Dict) -> str:
+        """Website (Google Maps URLs included) from a sidebar candidate."""
+        website_text = hit['text'] or hit['href'] or hit['aria']
+        if website_text:
+            # Clean up website text
+            if 'Website:' in website_text:
+                website_text = website_text.replace('Website:', '').strip()
+            
+            # Store Google Maps URL as website
+            if _WEBSITE_TEXT_RE.search(website_text):
+                return website_text
+        return ""
+    
+    def _read_quick_hours(self, hit: Dict) -> str:
+        """Opening hours from a sidebar candidate."""
+        hours_text = hit['text'] or hit['aria']
+        if hours_text and len(hours_text) < 200:  # Reasonable hours length
+            hours_low = hours_text.lower()
+            if any(time_word in hours_low for time_word in ['am', 'pm', 'open', 'closed', 'hours']):
+                return hours_text
+        return ""
+    
     def _extract_business_data_from_element(self, element, index: int) -> Optional[Dict]:
         """Extract business data from a single search result element with enhanced robustness."""
         try:
             self.logger.debug(f"Extracting data from element {index}")
             
+            # Businesses seen before are served from the cache without touching the DOM
+            cache_key = element.get_attribute('data-cid') or element.get_attribute('href')
+            if cache_key and cache_key in self._extract_cache:
+                return dict(self._extract_cache[cache_key], index=index)
+            
             # First attempt: Extract basic info directly from the element
             basic_data = self._extract_basic_data_from_element(element, index)
             
             # Initialize with basic data
             business_data = basic_data.copy() if basic_data else {'index': index}
             
-            # Attempt to click for detailed information
+            # Attempt to click for detailed information, unless the card already
+            # has every required field or details are switched off
             detailed_data = None
             click_successful = False
+            needs_details = self.detail_fields_needed and not all(business_data.get(field) for field in _REQUIRED_FIELDS)
             
-            try:
-                # Ensure element is in view and clickable
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                time.sleep(0.3)  # Brief pause for scrolling
-                
-                # Multiple click strategies
-                click_methods = [
-                    lambda: element.click(),
-                    lambda: self.actions.move_to_element(element).click().perform(),
-                    lambda: self.driver.execute_script("arguments[0].click();", element)
-                ]
-                
-                for method in click_methods:
-                    try:
-                        method()
-                        click_successful = True
-                        self.logger.debug(f"✓ Click successful for element {index}")
-                        break
-                    except Exception as click_error:
-                        self.logger.debug(f"Click method failed: {click_error}")
-                        continue
-                
-                if click_successful:
-                    # Wait for sidebar to load and extract detailed data
-                    self._wait_for_sidebar_to_load()
-                    detailed_data = self._extract_detailed_data_from_sidebar()
-                    
-                    # If we got a name from sidebar, use it
-                    sidebar_name = self._extract_sidebar_name()
-                    if sidebar_name:
-                        business_data['name'] = sidebar_name
+            if needs_details:
+                try:
+                    # Scroll into view and click in the page; native clicks are
+                    # usually intercepted by the Maps overlays
+                    self.driver.execute_script(_SCROLL_AND_CLICK_JS, element)
+                    click_successful = True
+                    self.logger.debug(f"✓ Click successful for element {index}")
                     
-                    # Merge detailed data
-                    if detailed_data:
-                        business_data.update({k: v for k, v in detailed_data.items() if v})
+                    if click_successful:
+                        # Wait for sidebar to load and extract detailed data
+                        self._wait_for_sidebar_to_load()
+                        detailed_data = self._extract_detailed_data_from_sidebar()
                         
-            except Exception as click_error:
-                self.logger.warning(f"Could not click element {index} for detailed info: {click_error}")
+                        # Merge detailed data (a name from the sidebar replaces the card's)
+                        if detailed_data:
+                            business_data.update({k: v for k, v in detailed_data.items() if v})
+                            
+                except Exception as click_error:
+                    self.logger.warning(f"Could not click element {index} for detailed info: {click_error}")
             
             # Validation and enhancement of extracted data
             if not business_data.get('name'):
-                # Try alternative name extraction methods
+                # Try alternative name extraction methods; text and aria-label
+                # come back together, the title only when needed
+                try:
+                    text, aria_label = self._get_text_and_aria(element)
+                except WebDriverException:
+                    text = aria_label = ''
                 name_attempts = [
-                    lambda: element.get_attribute('aria-label'),
+                    lambda: aria_label,
                     lambda: element.get_attribute('title'),
-                    lambda: element.text.strip(),
+                    lambda: text,
                 ]
                 
                 for method in name_attempts:
@@ -834,20 +1610,17 @@ Solutions to try:
                         if name and len(name.strip()) > 1:
                             business_data['name'] = name.strip()
                             break
-                    except:
+                    except WebDriverException:
                         continue
             
             # If we still don't have a name, extract from any text content
             if not business_data.get('name'):
                 try:
-                    # Look for any text content in the element
-                    text_elements = element.find_elements(By.XPATH, ".//*[text()]")
-                    for text_elem in text_elements[:3]:  # Check first few text elements
-                        text = text_elem.text.strip()
-                        if text and len(text) > 2 and not text.isdigit():
-                            business_data['name'] = text
-                            break
-                except:
+                    # First non-numeric text node in the element, found in the browser
+                    text = self.driver.execute_script(_FIRST_TEXT_JS, element)
+                    if text:
+                        business_data['name'] = text
+                except WebDriverException:
                     pass
             
             # Last resort - use element attributes or create placeholder
@@ -868,6 +1641,8 @@ Solutions to try:
             # Final validation
             if business_data.get('name') and len(business_data['name'].strip()) > 0:
                 self.logger.debug(f"[SUCCESS] Successfully extracted data for: {business_data['name']}")
+                if cache_key and all(business_data.get(field) for field in _REQUIRED_FIELDS):
+                    self._extract_cache[cache_key] = dict(business_data)
                 return business_data
             else:
                 self.logger.warning(f"[FAIL] Failed to extract valid business data from element {index}")
@@ -894,109 +1669,95 @@ Solutions to try:
         """Wait for the sidebar to fully load with business content."""
         try:
             # Wait for sidebar container to appear
-            sidebar_selectors = [
-                '[role="main"] > div:nth-child(2)',  # Main sidebar container
-                '.m6QErb[data-value]',  # Sidebar with data
-                '[data-attrid="title"]',  # Business title in sidebar
-                '.DUwDvf.lfPIob',  # Business name
-                '.fontHeadlineSmall'  # Alternative business name
-            ]
-            
-            sidebar_loaded = False
-            max_wait_time = 3.0  # Maximum 3 seconds wait
-            start_time = time.time()
+            self._sidebar_wait.until(
+                lambda d: d.execute_script(_SIDEBAR_LOADED_JS, _SIDEBAR_LOADED_SELECTORS, _SIDEBAR_TITLE_SELECTORS)
+            )
             
-            while not sidebar_loaded and (time.time() - start_time) < max_wait_time:
-                for selector in sidebar_selectors:
-                    try:
-                        element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        if element and element.is_displayed():
-                            # Additional check: make sure it has actual content
-                            if selector in ['[data-attrid="title"]', '.DUwDvf.lfPIob', '.fontHeadlineSmall']:
-                                if element.text.strip():  # Has actual text content
-                                    sidebar_loaded = True
-                                    break
-                            else:
-                                sidebar_loaded = True
-                                break
-                    except:
-                        continue
-                
-                if not sidebar_loaded:
-                    time.sleep(0.1)  # Small incremental wait
-            
-            # Additional small wait to ensure content is stable
-            time.sleep(1.3)  # As requested by user
+            # Then for the detail rows, for no longer than the old fixed settle time.
+            # Images, fonts and media are blocked at launch (see _new_session), so
+            # the rows usually arrive with the title rather than after asset loads
+            WebDriverWait(self.driver, 1.3, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, _SIDEBAR_DETAIL_ROWS))
+            )
             
+        except TimeoutException:
+            self.logger.debug("Sidebar did not finish loading in time")
         except Exception as e:
             self.logger.debug(f"Error waiting for sidebar: {e}")
-            time.sleep(2)  # Fallback wait
 
+    def _snapshot_and_parse(self, element):
+        """Fetch the result card around an element in one round-trip and parse it with lxml."""
+        try:
+            outer_html = self.driver.execute_script(
+                "const el = arguments[0]; return (el.closest('.Nv2PK') || el.parentElement || el).outerHTML;",
+                element
+            )
+            return lxml_html.fromstring(outer_html) if outer_html else None
+        except Exception as e:
+            self.logger.debug(f"Could not snapshot DOM: {e}")
+            return None
+    
+    def _get_text_and_aria(self, element) -> Tuple[str, str]:
+        """Rendered text and aria-label of an element, read in one round-trip."""
+        text, aria_label = self.driver.execute_script(_TEXT_AND_ARIA_JS, element)
+        return text, aria_label
+    
     def _extract_basic_data_from_element(self, element, index: int) -> Dict:
         """Extract comprehensive business data directly from search result element with enhanced extraction."""
         try:
-            business_data = {'index': index}
-            
-            # Enhanced name extraction with more selectors and fallbacks
-            name_selectors = [
-                '.fontHeadlineSmall',
-                '.DUwDvf',
-                '[role="heading"]',
-                'h3',
-                'h2',
-                '.qBF1Pd',
-                '.fontBodyMedium',
-                'div.fontBodyMedium > span',
-                '.section-result-title',
-                'a[data-value]'
-            ]
+            business_data = _BUSINESS_TEMPLATE.copy()
+            business_data['index'] = index
             
-            name_found = False
-            for selector in name_selectors:
+            # Parse the card HTML locally first: one round-trip instead of one per field
+            tree = self._snapshot_and_parse(element)
+            if tree is not None:
+                for field, xpath in _CARD_XPATHS:
+                    values = [value.strip() for value in xpath(tree) if value.strip()]
+                    if values:
+                        business_data[field] = values[0]
+                
+                reviews = business_data['reviews_count'].strip('() ').replace(',', '')
+                business_data['reviews_count'] = reviews if reviews.isdigit() else ''
+                
+                rating = business_data['rating'].replace(',', '.')
                 try:
-                    name_elements = element.find_elements(By.CSS_SELECTOR, selector)
-                    for name_elem in name_elements:
-                        if name_elem and name_elem.text.strip():
-                            text = name_elem.text.strip()
-                            # Filter out obvious non-business names
-                            if len(text) > 1 and not text.isdigit() and 'directions' not in text.lower():
-                                business_data['name'] = text
-                                name_found = True
-                                break
+                    business_data['rating'] = rating if rating and 0 <= float(rating) <= 5 else ''
+                except ValueError:
+                    business_data['rating'] = ''
+            
+            # Enhanced name extraction with more selectors and fallbacks
+            name_found = bool(business_data['name'])
+            if not name_found and tree is not None:
+                for selector in _CARD_NAME_CSS:
+                    for name_elem in selector(tree):
+                        text = _node_text(name_elem)
+                        # Filter out obvious non-business names
+                        if len(text) > 1 and not text.isdigit() and 'directions' not in text.lower():
+                            business_data['name'] = text
+                            name_found = True
+                            break
                     if name_found:
                         break
-                except:
-                    continue
+            
+            # The card's text (parsed further below) and aria-label in one call
+            try:
+                full_text, aria_label = self._get_text_and_aria(element)
+            except WebDriverException:
+                full_text = aria_label = ''
             
             # Fallback name extraction from attributes
-            if not name_found:
-                try:
-                    aria_label = element.get_attribute('aria-label')
-                    if aria_label and len(aria_label.strip()) > 1:
-                        business_data['name'] = aria_label.strip()
-                        name_found = True
-                except:
-                    pass
+            if not name_found and len(aria_label.strip()) > 1:
+                business_data['name'] = aria_label.strip()
+                name_found = True
             
             # Enhanced rating extraction with more comprehensive search
-            rating_selectors = [
-                '.MW4etd',
-                '.fontBodySmall .MW4etd',
-                '[aria-label*="stars"]',
-                '.review-score',
-                'span[aria-label*="star"]',
-                '.F7nice span',
-                '.fontBodySmall span:first-child'
-            ]
-            
-            for selector in rating_selectors:
-                try:
-                    rating_elements = element.find_elements(By.CSS_SELECTOR, selector)
-                    for rating_elem in rating_elements:
-                        text = rating_elem.text.strip() or rating_elem.get_attribute('aria-label') or ""
+            if not business_data['rating'] and tree is not None:
+                for selector in _CARD_RATING_CSS:
+                    for rating_elem in selector(tree):
+                        text = _node_text(rating_elem) or rating_elem.get('aria-label') or ""
                         if text:
                             # Extract numeric rating
-                            rating_match = re.search(r'(\d+\.?\d*)', text)
+                            rating_match = _RATING_RE.search(text)
                             if rating_match:
                                 rating = rating_match.group(1)
                                 try:
@@ -1006,175 +1767,143 @@ Solutions to try:
                                         break
                                 except ValueError:
                                     continue
-                except:
-                    continue
-                    
-            # Try to extract reviews count from various locations
-            reviews_selectors = [
-                'span[aria-label*="reviews"]',
-                'button[aria-label*="reviews"]',
-                '.fontBodySmall span:contains("(")',
-                '.F7nice .fontBodySmall'
-            ]
+                    if business_data['rating']:
+                        break
             
-            for selector in reviews_selectors:
-                try:
-                    reviews_elements = element.find_elements(By.CSS_SELECTOR, selector)
-                    for reviews_elem in reviews_elements:
-                        text = reviews_elem.text or reviews_elem.get_attribute('aria-label') or ""
+            # Try to extract reviews count from various locations
+            if not business_data['reviews_count'] and tree is not None:
+                for selector in _CARD_REVIEWS_CSS:
+                    for reviews_elem in selector(tree):
+                        text = _node_text(reviews_elem) or reviews_elem.get('aria-label') or ""
                         if text:
                             # Extract number from text like "(860)" or "860 reviews"
-                            count_match = re.search(r'[\(\s](\d+)[\)\s]', text)
+                            count_match = _COUNT_RE.search(text)
                             if count_match:
                                 business_data['reviews_count'] = count_match.group(1)
                                 break
                             # Also try simple number extraction
-                            simple_match = re.search(r'(\d+)', text)
+                            simple_match = _NUMBER_RE.search(text)
                             if simple_match and len(simple_match.group(1)) > 1:  # At least 2 digits
                                 business_data['reviews_count'] = simple_match.group(1)
                                 break
-                except:
-                    continue
+                    if business_data['reviews_count']:
+                        break
             
             # Enhanced category extraction
-            category_selectors = [
-                '.fontBodySmall',
-                '.DkEaL',
-                '.W4Efsd:nth-child(2)',
-                '.W4Efsd',
-                'button.DkEaL',
-                '.section-result-category',
-                '.fontBodySmall:not(:has(.MW4etd))'  # Exclude elements with ratings
-            ]
-            
-            for selector in category_selectors:
-                try:
-                    category_elements = element.find_elements(By.CSS_SELECTOR, selector)
-                    for category_elem in category_elements:
-                        if category_elem and category_elem.text.strip():
-                            text = category_elem.text.strip()
-                            # More sophisticated filtering
-                            if (len(text) > 2 and 
-                                not text.replace('.', '').replace(',', '').isdigit() and  # Not just numbers
-                                'directions' not in text.lower() and
-                                not re.match(r'^\d+\.\d+\s', text) and  # Not rating format
-                                not re.match(r'^\(\d+\)', text) and  # Not review count format
-                                len(text) < 100 and  # Not too long description
-                                not any(char in text for char in ['$', '$$', '$$$', '$$$$'])):  # Not price range
-                                business_data['category'] = text
-                                break
-                except:
-                    continue
+            if not business_data['category'] and tree is not None:
+                for selector in _CARD_CATEGORY_CSS:
+                    for category_elem in selector(tree):
+                        text = _node_text(category_elem)
+                        # More sophisticated filtering
+                        if (len(text) > 2 and 
+                            not text.replace('.', '').replace(',', '').isdigit() and  # Not just numbers
+                            'directions' not in text.lower() and
+                            not _RATING_PREFIX_RE.match(text) and  # Not rating format
+                            not _COUNT_PREFIX_RE.match(text) and  # Not review count format
+                            len(text) < 100 and  # Not too long description
+                            '$' not in text):  # Not price range
+                            business_data['category'] = text
+                            break
+                    if business_data['category']:
+                        break
             
             # Enhanced website URL extraction from element links and text
-            try:
+            if tree is not None:
                 # First try to find actual clickable website links (keep Google Maps URLs)
-                website_links = element.find_elements(By.CSS_SELECTOR, 'a[href*="http"]')
-                for link in website_links:
-                    href = link.get_attribute('href')
-                    if href:
-                        business_data['website'] = href
-                        break
+                if not business_data['website']:
+                    for link in _CARD_LINK_CSS(tree):
+                        href = link.get('href')
+                        if href:
+                            business_data['website'] = href
+                            break
                         
                 # Extract business website from specific HTML structure (.gSkmPd elements)
-                try:
-                    business_website_elements = element.find_elements(By.CSS_SELECTOR, '.gSkmPd.fontBodySmall.DshQNd, .gSkmPd')
-                    for elem in business_website_elements:
-                        text = elem.text.strip()
-                        if text and any(domain in text for domain in ['.com', '.org', '.net', '.edu']) and 'google.com' not in text:
-                            business_data['business_website_url'] = text
-                            break
-                except:
-                    pass
+                website_url = _extract_business_website(_node_text(elem) for elem in _CARD_WEBSITE_TEXT_CSS(tree))
+                if website_url:
+                    business_data['business_website_url'] = website_url
                         
                 # Also look for website text patterns in element
-                if 'business_website_url' not in business_data:
-                    website_text_elements = element.find_elements(By.XPATH, ".//*[contains(text(), '.com') or contains(text(), '.org') or contains(text(), '.net')]")
-                    for elem in website_text_elements:
-                        text = elem.text.strip()
-                        if text and 'google.com' not in text and 'maps' not in text and len(text) < 100:
+                if not business_data['business_website_url']:
+                    for elem in _XP_DOMAIN_TEXT(tree):
+                        text = _node_text(elem)
+                        if text and not _GOOGLE_HOST_RE.search(text) and len(text) < 100:
                             # Validate it looks like a business website
-                            if re.match(r'^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', text) or any(domain in text for domain in ['.com', '.org', '.net']):
+                            if _DOMAIN_NAME_RE.match(text) or _DOMAIN_RE.search(text):
                                 business_data['business_website_url'] = text
                                 break
-            except:
-                pass
             
             # Try to extract additional info from the element's text content
             try:
-                full_text = element.text
                 if full_text:
-                    lines = [line.strip() for line in full_text.split('\n') if line.strip()]
+                    lines = [line for line in (raw.strip() for raw in full_text.splitlines()) if line]
                     
-                    # Process each line to extract different data types
-                    for line_idx, line in enumerate(lines):
-                        if not line:
-                            continue
-                        
-                        # Skip the business name line (usually first)
-                        if line_idx == 0 and business_data.get('name') and line in business_data['name']:
+                    # Skip the business name line (usually first)
+                    if lines and business_data['name'] and lines[0] in business_data['name']:
+                        lines = lines[1:]
+                    
+                    # Rating and review count in one pass over the text; lines
+                    # claimed here are not considered for the fields below
+                    claimed = set()
+                    text = '\n'.join(lines)
+                    for match in _CARD_TEXT_RE.finditer(text):
+                        field = match.lastgroup
+                        value = match.group(field)
+                        if field == 'reviews_text':
+                            field = 'reviews_count'
+                        if business_data.get(field):
                             continue
-                            
-                        # Look for rating patterns (e.g., "4.5", "4.5 stars")
-                        if 'rating' not in business_data or not business_data['rating']:
-                            rating_match = re.search(r'^(\d+\.?\d*)\s*(?:stars?)?$', line)
-                            if rating_match:
-                                rating = rating_match.group(1)
-                                if 0 <= float(rating) <= 5:
-                                    business_data['rating'] = rating
-                                    continue
                         
-                        # Look for review count patterns (e.g., "(1,234)", "1,234 reviews")
-                        if 'reviews_count' not in business_data or not business_data['reviews_count']:
-                            review_match = re.search(r'[\(\s]?(\d{1,3}(?:,\d{3})*|\d+)[\)\s]?\s*(?:reviews?)?', line)
-                            if review_match and len(review_match.group(1).replace(',', '')) >= 2:  # At least 2 digits
-                                business_data['reviews_count'] = review_match.group(1).replace(',', '')
+                        if field == 'rating':
+                            if not 0 <= float(value) <= 5:
                                 continue
+                        elif field == 'reviews_count':
+                            value = value.replace(',', '')
+                            if len(value) < 2:  # At least 2 digits
+                                continue
+                        
+                        business_data[field] = value
+                        claimed.add(text.count('\n', 0, match.start()))
+                    
+                    # Price range and hours, from any line; they claim nothing
+                    for field, pattern in _CARD_LINE_FIELDS:
+                        if not business_data[field]:
+                            match = pattern.search(text)
+                            if match:
+                                business_data[field] = match.group()
+                    
+                    # Process each remaining line to extract different data types
+                    for line_idx, line in enumerate(lines):
+                        if line_idx in claimed:
+                            continue
                         
                         # Look for category patterns (restaurant types, etc.)
-                        if ('category' not in business_data or not business_data['category']) and len(line) < 100:
+                        if not business_data['category'] and len(line) < 100:
                             # Common restaurant/business categories
-                            category_keywords = ['restaurant', 'cafe', 'bar', 'grill', 'kitchen', 'bistro', 'steakhouse', 'diner', 'eatery', 'bakery', 'pizzeria', 'shop', 'store', 'market']
-                            if (any(keyword in line.lower() for keyword in category_keywords) or
+                            if (_CATEGORY_WORDS_RE.search(line) or
                                 (len(line) > 5 and len(line) < 50 and 
                                  not any(char.isdigit() for char in line) and 
                                  not any(symbol in line for symbol in ['$', '(', ')', '•', '★']) and
-                                 'open' not in line.lower() and 'close' not in line.lower())):
+                                 not _OPEN_CLOSE_RE.search(line))):
                                 business_data['category'] = line
                                 continue
                         
-                        # Look for price range indicators
-                        if ('price_range' not in business_data or not business_data['price_range']):
-                            if any(price in line for price in ['$', '$$', '$$$', '$$$$']) and len(line) < 20:
-                                business_data['price_range'] = line
-                                continue
-                        
                         # Look for address patterns
-                        if ('address' not in business_data or not business_data['address']):
-                            if ((any(word in line.lower() for word in ['street', 'st', 'ave', 'avenue', 'road', 'rd', 'blvd', 'way', 'place', 'drive', 'dr']) or
-                                 re.search(r'\d+.*\w+.*(?:\d{5}|NY|New York)', line)) and
+                        if not business_data['address']:
+                            if ((_ADDR_WORDS_RE.search(line) or
+                                 _ADDR_ZIP_RE.search(line)) and
                                 len(line) > 15 and len(line) < 200):
                                 business_data['address'] = line
                                 continue
                             
-                        # Look for hours
-                        if ('hours' not in business_data or not business_data['hours']):
-                            if (any(time_word in line.lower() for time_word in ['open', 'close', 'hours', 'pm', 'am']) and
-                                len(line) < 100):
-                                business_data['hours'] = line
-                                continue
-                                
                         # Look for website URLs
-                        if ('website' not in business_data or not business_data['website']):
-                            if (('http' in line or '.com' in line or '.org' in line or '.net' in line) and 
-                                len(line) < 200):
+                        if not business_data['website']:
+                            if _WEBSITE_TEXT_RE.search(line) and len(line) < 200:
                                 business_data['website'] = line
                                 continue
                                 
                         # Look for business website URLs (excluding Google URLs)
-                        if ('business_website_url' not in business_data or not business_data['business_website_url']):
-                            if (('.com' in line or '.org' in line or '.net' in line or '.edu' in line) and 
-                                'google.com' not in line and 'maps' not in line and len(line) < 100):
+                        if not business_data['business_website_url']:
+                            if _DOMAIN_RE.search(line) and not _GOOGLE_HOST_RE.search(line) and len(line) < 100:
                                 business_data['business_website_url'] = line
                                 continue
                                 
@@ -1187,178 +1916,102 @@ Solutions to try:
             self.logger.debug(f"Error extracting basic data from element {index}: {str(e)}")
             return {'index': index}
 
-    def _extract_detailed_data_from_sidebar(self) -> Dict:
-        """Extract detailed business data from the opened sidebar."""
+    def _extract_detailed_data_from_sidebar(self, driver=None) -> Dict:
+        """Extract detailed business data from the opened sidebar (of `driver`, default the main browser)."""
+        # Every field's selector cascade is resolved in one script call, in
+        # declared order; validation below runs on the returned hits
+        try:
+            hits = (driver or self.driver).execute_script(_SIDEBAR_JS, _SIDEBAR_FIELD_SELECTORS) or {}
+        except WebDriverException as e:
+            self.logger.debug(f"Sidebar harvest failed: {e}")
+            return {}
+        
         return {
-            'rating': self._extract_sidebar_rating(),
-            'reviews_count': self._extract_sidebar_reviews_count(),
-            'category': self._extract_sidebar_category(),
-            'address': self._extract_sidebar_address(),
-            'phone': self._extract_sidebar_phone(),
-            'website': self._extract_sidebar_website(),
-            'hours': self._extract_sidebar_hours(),
-            'price_range': self._extract_sidebar_price_range(),
-            'description': self._extract_sidebar_description()
+            'name': self._extract_sidebar_name(hits.get('name', [])),
+            'rating': self._extract_sidebar_rating(hits.get('rating', [])),
+            'reviews_count': self._extract_sidebar_reviews_count(hits.get('reviews_count', [])),
+            'category': self._extract_sidebar_category(hits.get('category', [])),
+            'address': self._extract_sidebar_address(hits.get('address', [])),
+            'phone': self._extract_sidebar_phone(hits.get('phone', [])),
+            'website': self._extract_sidebar_website(hits.get('website', [])),
+            'hours': self._extract_sidebar_hours(hits.get('hours', [])),
+            'price_range': self._extract_sidebar_price_range(hits.get('price_range', [])),
+            'description': self._extract_sidebar_description(hits.get('description', []))
         }
     
-    def _extract_sidebar_name(self) -> str:
+    def _extract_sidebar_name(self, hits: List[Dict]) -> str:
         """Extract business name from the sidebar."""
-        selectors = [
-            'h1.DUwDvf',
-            'h1[data-attrid="title"]',
-            '.DUwDvf.lfPIob',
-            '[role="main"] h1',
-            '.fontHeadlineSmall',
-            'h1'
-        ]
-        
-        for selector in selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                text = element.text.strip()
-                if text and len(text) > 1 and 'Directions' not in text:
-                    return text
-            except NoSuchElementException:
-                continue
+        for hit in hits:
+            text = hit['text']
+            if text and len(text) > 1 and 'Directions' not in text:
+                return text
         
         return ""
     
-    def _extract_sidebar_rating(self) -> str:
+    def _extract_sidebar_rating(self, hits: List[Dict]) -> str:
         """Extract business rating from the sidebar."""
-        selectors = [
-            '.F7nice span[aria-label*="stars"]',
-            '.F7nice .fontBodyMedium',
-            'span[aria-label*="star"]',
-            '.F7nice span',
-            '.dmRWX .F7nice'
-        ]
-        
-        for selector in selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                text = element.text or element.get_attribute('aria-label') or ""
-                if text:
-                    # Extract numeric rating
-                    rating_match = re.search(r'(\d+\.?\d*)', text)
-                    if rating_match:
-                        rating = rating_match.group(1)
-                        try:
-                            rating_float = float(rating)
-                            if 0 <= rating_float <= 5:
-                                return rating
-                        except ValueError:
-                            continue
-            except NoSuchElementException:
-                continue
+        # The number is parsed in the page; only its range is checked here
+        for hit in hits:
+            rating = hit['number']
+            if rating and 0 <= float(rating) <= 5:
+                return rating
         
         return ""
     
-    def _extract_sidebar_reviews_count(self) -> str:
+    def _extract_sidebar_reviews_count(self, hits: List[Dict]) -> str:
         """Extract number of reviews from the sidebar."""
-        selectors = [
-            '.F7nice span[aria-label*="reviews"]',
-            'span[aria-label*="reviews"]',
-            'button[aria-label*="reviews"]'
-        ]
-        
-        for selector in selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                text = element.text or element.get_attribute('aria-label')
-                if text:
-                    # Extract number from text like "(860)" or "860 reviews"
-                    count_match = re.search(r'[\(\s](\d+)[\)\s]', text)
-                    if count_match:
-                        return count_match.group(1)
-            except NoSuchElementException:
-                continue
+        # Count from text like "(860)" or "860 reviews", parsed in the page
+        for hit in hits:
+            if hit['count']:
+                return hit['count']
         
         return ""
     
-    def _extract_sidebar_category(self) -> str:
+    def _extract_sidebar_category(self, hits: List[Dict]) -> str:
         """Extract business category from the sidebar."""
-        selectors = [
-            'button[jsaction*="category"]',
-            '.DkEaL',
-            'button.DkEaL',
-            '.skqShb button'
-        ]
-        
-        for selector in selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                text = element.text.strip()
-                if text and 'directions' not in text.lower():
-                    return text
-            except NoSuchElementException:
-                continue
+        for hit in hits:
+            text = hit['text']
+            if text and 'directions' not in text.lower():
+                return text
         
         return ""
     
-    def _extract_sidebar_address(self) -> str:
+    def _extract_sidebar_address(self, hits: List[Dict]) -> str:
         """Extract business address from the sidebar."""
-        selectors = [
-            'button[data-item-id="address"]',
-            'button[aria-label*="Address"]',
-            '.Io6YTe.fontBodyMedium.kR99db.fdkmkc',
-            'button.CsEnBe[aria-label*="Address"]'
-        ]
-        
-        for selector in selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                aria_label = element.get_attribute('aria-label') or ""
-                if 'Address:' in aria_label:
-                    address = aria_label.replace('Address:', '').strip()
-                    if address and len(address) > 10:
-                        return address
-                
-                # Try inner text
-                text_element = element.find_element(By.CSS_SELECTOR, '.Io6YTe')
-                text = text_element.text.strip()
-                if text and len(text) > 10:
-                    return text
-                    
-            except NoSuchElementException:
-                continue
+        for hit in hits:
+            aria_label = hit['aria']
+            if 'Address:' in aria_label:
+                address = aria_label.replace('Address:', '').strip()
+                if address and len(address) > 10:
+                    return address
+            
+            # Try inner text
+            text = hit['inner']
+            if text and len(text) > 10:
+                return text
         
         return ""
     
-    def _extract_sidebar_phone(self) -> str:
+    def _extract_sidebar_phone(self, hits: List[Dict]) -> str:
         """Extract business phone number from the sidebar."""
-        selectors = [
-            'button[data-item-id*="phone"]',
-            'button[aria-label*="Phone"]',
-            'a[href^="tel:"]',
-            'button[aria-label*="Call"]'
-        ]
-        
-        for selector in selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                
-                # Try aria-label first
-                aria_label = element.get_attribute('aria-label') or ""
-                if 'Phone:' in aria_label:
-                    phone = aria_label.replace('Phone:', '').strip()
-                    if self._is_valid_phone(phone):
-                        return phone
-                
-                # Try href for tel: links
-                href = element.get_attribute('href') or ""
-                if href.startswith('tel:'):
-                    phone = href.replace('tel:', '').strip()
-                    if self._is_valid_phone(phone):
-                        return phone
-                
-                # Try inner text
-                text_element = element.find_element(By.CSS_SELECTOR, '.Io6YTe')
-                text = text_element.text.strip()
-                if self._is_valid_phone(text):
-                    return text
-                    
-            except NoSuchElementException:
-                continue
+        for hit in hits:
+            # Try aria-label first
+            aria_label = hit['aria']
+            if 'Phone:' in aria_label:
+                phone = aria_label.replace('Phone:', '').strip()
+                if self._is_valid_phone(phone):
+                    return phone
+            
+            # Try href for tel: links
+            href = hit['href']
+            if href.startswith('tel:'):
+                phone = href.replace('tel:', '').strip()
+                if self._is_valid_phone(phone):
+                    return phone
+            
+            # Try inner text
+            if self._is_valid_phone(hit['inner']):
+                return hit['inner']
         
         return ""
     
@@ -1366,124 +2019,190 @@ Solutions to try:
         """Check if a string looks like a valid phone number."""
         if not phone:
             return False
-        # Check for basic phone patterns
-        phone_pattern = r'[\+\(\)\-\s\d]{10,}'
-        return bool(re.search(phone_pattern, phone)) and len(re.findall(r'\d', phone)) >= 10
+        # At least ten ASCII digits (counted without building a match list,
+        # compiled or not), then the phone-shaped run check only for strings that pass
+        count_digits = self._count_digits or _count_ascii_digits
+        digits = count_digits(phone.encode('ascii', 'ignore'))
+        return digits >= 10 and bool(_PHONE_RE.search(phone))
     
-    def _extract_sidebar_website(self) -> str:
+    def _extract_sidebar_website(self, hits: List[Dict]) -> str:
         """Extract business website from the sidebar."""
-        selectors = [
-            'a[data-item-id="authority"]',
-            'a[href^="http"]:not([href*="google"])',
-            'button[aria-label*="website"] + div a'
-        ]
-        
-        for selector in selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                href = element.get_attribute('href')
-                if href and not 'google' in href.lower() and href.startswith('http'):
-                    return href
-            except NoSuchElementException:
-                continue
+        for hit in hits:
+            href = hit['href']
+            if href.startswith(('http://', 'https://')) and 'google' not in href.lower():
+                return href
         
         return ""
     
-    def _extract_sidebar_hours(self) -> str:
+    def _extract_sidebar_hours(self, hits: List[Dict]) -> str:
         """Extract business hours from the sidebar."""
-        selectors = [
-            'button[data-item-id="oh"]',
-            'button[aria-label*="hours"]',
-            '.Io6YTe.fontBodyMedium.kR99db.fdkmkc'
-        ]
-        
-        for selector in selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                text_element = element.find_element(By.CSS_SELECTOR, '.Io6YTe')
-                text = text_element.text.strip()
-                if text and ('open' in text.lower() or 'closed' in text.lower() or ':' in text):
-                    return text
-            except NoSuchElementException:
-                continue
+        for hit in hits:
+            text = hit['inner']
+            text_low = text.lower()
+            if text and ('open' in text_low or 'closed' in text_low or ':' in text):
+                return text
         
         return ""
     
-    def _extract_sidebar_price_range(self) -> str:
+    def _extract_sidebar_price_range(self, hits: List[Dict]) -> str:
         """Extract price range from the sidebar."""
-        try:
-            # Look for price indicators like $ $$ $$$
-            price_elements = self.driver.find_elements(By.CSS_SELECTOR, '[aria-label*="Price"], .price, [data-price]')
-            for element in price_elements:
-                text = element.text or element.get_attribute('aria-label')
-                if text and ('$' in text or 'price' in text.lower()):
-                    return text.strip()
-        except Exception as e:
-            self.logger.debug(f"Error extracting price range: {str(e)}")
+        # Look for price indicators like $ $$ $$$
+        for hit in hits:
+            text = hit['text'] or hit['aria']
+            if text and ('$' in text or 'price' in text.lower()):
+                return text.strip()
         
         return ""
     
-    def _extract_sidebar_description(self) -> str:
+    def _extract_sidebar_description(self, hits: List[Dict]) -> str:
         """Extract business description from the sidebar."""
-        selectors = [
-            '.wiI7pd',
-            '.VpMB0',
-            '.section-editorial-quote',
-            '.section-editorial-text'
-        ]
-        
-        for selector in selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                text = element.text.strip()
-                if text and len(text) > 20 and 'ago' not in text.lower():
-                    return text[:500]  # Limit description length
-            except NoSuchElementException:
-                continue
+        for hit in hits:
+            text = hit['text']
+            if text and len(text) > 20 and 'ago' not in text.lower():
+                return text[:500]  # Limit description length
         
         return ""
     
-    def save_to_csv(self, businesses: List[Dict], filename: str = None):
+    def save_to_csv(self, businesses: List[Dict], filename: str = None, stamp: int = None):
         """Save scraped business data to CSV file."""
         if not filename:
-            filename = f"google_businesses_{int(time.time())}.csv"
+            filename = f"google_businesses_{stamp or time.time_ns()}.csv"
         
         if not businesses:
             self.logger.warning("No business data to save")
             return
         
         try:
-            df = pd.DataFrame(businesses)
-            df.to_csv(filename, index=False, encoding='utf-8')
+            # Columns in first-seen order, missing values left empty
+            fieldnames = list(dict.fromkeys(key for business in businesses for key in business))
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(businesses)
             self.logger.info(f"Saved {len(businesses)} businesses to {filename}")
         except Exception as e:
             self.logger.error(f"Error saving to CSV: {str(e)}")
     
-    def save_to_json(self, businesses: List[Dict], filename: str = None):
+    def save_to_json(self, businesses: List[Dict], filename: str = None, stamp: int = None):
         """Save scraped business data to JSON file."""
         if not filename:
-            filename = f"google_businesses_{int(time.time())}.json"
+            filename = f"google_businesses_{stamp or time.time_ns()}.json"
         
         if not businesses:
             self.logger.warning("No business data to save")
             return
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(businesses, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                # Encoded in C and written in one call; output is UTF-8 like the fallback
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(businesses, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(businesses, f, indent=2, ensure_ascii=False)
             self.logger.info(f"Saved {len(businesses)} businesses to {filename}")
         except Exception as e:
             self.logger.error(f"Error saving to JSON: {str(e)}")
     
     def close(self):
-        """Close the WebDriver."""
+        """Quit the WebDriver, or return it to the session pool when reuse_driver is set."""
+        self._save_extract_cache()
         if self.driver:
-            self.driver.quit()
-            self.logger.info("WebDriver closed")
+            self._release_driver(self.driver)
+            self.driver = None
+
+
+class BrowserPool:
+    """
+    A fixed set of browser sessions shared by worker threads.
+    
+    WebDriver sessions are not thread-safe, so each session serves one thread
+    at a time; sessions are released like the scraper's own (see reuse_driver).
+    """
+    
+    def __init__(self, scraper: GoogleBusinessScraper, size: int):
+        self._scraper = scraper
+        self._size = size
+        self._idle = queue.Queue()
+        for _ in range(size):
+            self._idle.put(scraper._setup_driver(scraper.headless))
+    
+    def _call(self, fn, item):
+        driver = self._idle.get()
+        try:
+            return fn(driver, item)
+        finally:
+            self._idle.put(driver)
+    
+    def map(self, fn, items: List) -> List:
+        """Run fn(driver, item) for every item across the pool, preserving order."""
+        with ThreadPoolExecutor(max_workers=self._size) as executor:
+            return list(executor.map(lambda item: self._call(fn, item), items))
+    
+    def close(self):
+        """Release every session through the scraper."""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._scraper._release_driver(driver)
+
+
+atexit.register(GoogleBusinessScraper.close_pool)
+
+
+def _init_worker():
+    """
+    Drop the ChromeDriver service and pooled sessions a forked worker inherits.
+    
+    They belong to the parent process; the worker starts its own instead of
+    driving the parent's Chrome.
+    """
+    global _SERVICE, _SERVICE_LOCK
+    _SERVICE = None
+    _SERVICE_LOCK = threading.Lock()
+    GoogleBusinessScraper._driver_pools = {
+        True: queue.Queue(maxsize=_DRIVER_POOL_SIZE),
+        False: queue.Queue(maxsize=_DRIVER_POOL_SIZE)
+    }
+
+
+def _worker(query_location: Tuple[str, str]) -> List[Dict]:
+    """Scrape a single (query, location) pair in its own process and browser."""
+    scraper = GoogleBusinessScraper(headless=True)
+    try:
+        return scraper.search_businesses(*query_location)
+    finally:
+        scraper.close()
+        # Pool workers are terminated without running atexit handlers, so stop
+        # this process's ChromeDriver service here
+        GoogleBusinessScraper.close_pool()
+
+
+def scrape_many(pairs: List[Tuple[str, str]], processes: int = 4) -> List[List[Dict]]:
+    """
+    Scrape several (query, location) pairs in parallel.
+    
+    WebDriver sessions are not thread-safe, so each pair runs in a separate
+    process that owns its own Chrome instance.
+    
+    Args:
+        pairs (List[Tuple[str, str]]): (query, location) pairs to search for
+        processes (int): Number of worker processes
+        
+    Returns:
+        List[List[Dict]]: Businesses for each pair, in input order
+    """
+    with multiprocessing.Pool(processes, initializer=_init_worker) as pool:
+        return pool.map(_worker, pairs)
 
 
 def main():
     """Main function to run the Google Business Scraper."""
+    # Single timestamp shared by every output file of this run
+    stamp = time.time_ns()
+    
     print("=" * 60)
     print("         Google Business Listing Scraper")
     print("=" * 60)
@@ -1532,15 +2251,14 @@ def main():
                 print(f"   ... and {len(businesses) - 5} more businesses")
             
             # Save results
-            timestamp = int(time.time())
-            safe_query = re.sub(r'[^\w\s-]', '', query).strip().replace(' ', '_')
-            safe_location = re.sub(r'[^\w\s-]', '', location).strip().replace(' ', '_')
+            safe_query = _SAFE_NAME_RE.sub('', query).strip().replace(' ', '_')
+            safe_location = _SAFE_NAME_RE.sub('', location).strip().replace(' ', '_')
             
-            csv_filename = f"{safe_query}_{safe_location}_{timestamp}.csv"
-            json_filename = f"{safe_query}_{safe_location}_{timestamp}.json"
+            csv_filename = f"{safe_query}_{safe_location}_{stamp}.csv"
+            json_filename = f"{safe_query}_{safe_location}_{stamp}.json"
             
-            scraper.save_to_csv(businesses, csv_filename)
-            scraper.save_to_json(businesses, json_filename)
+            scraper.save_to_csv(businesses, csv_filename, stamp)
+            scraper.save_to_json(businesses, json_filename, stamp)
             
             print(f"\nResults saved to:")
             print(f"   {csv_filename}")
@@ -0,0 +1,20 @@
+"""
+One scraper (and browser) shared by the test scripts in this folder
+"""
+
+import atexit
+from google_business_scraper import GoogleBusinessScraper
+
+# The one configuration every test script runs with
+SCRAPER_OPTIONS = {'headless': True, 'timeout': 20}
+
+# Created on first use and closed at exit
+_scraper = None
+
+def get_shared_scraper():
+    """Return the shared scraper, starting it on first use"""
+    global _scraper
+    if _scraper is None:
+        _scraper = GoogleBusinessScraper(**SCRAPER_OPTIONS)
+        atexit.register(_scraper.close)
+    return _scraper
@@ -2,14 +2,102 @@
 Advanced scraper with additional features like review extraction and popular times
 """
 
-from google_business_scraper import GoogleBusinessScraper
+from google_business_scraper import GoogleBusinessScraper, _SIDEBAR_LOADED_JS, _SIDEBAR_LOADED_SELECTORS, _SIDEBAR_TITLE_SELECTORS
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import time
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, JavascriptException
 import json
 from typing import List, Dict, Optional
 
+# Clicks "See more" on every truncated review among the first arguments[0] and
+# returns how many were clicked; Maps expands them asynchronously
+_EXPAND_REVIEWS_JS = """
+let clicked = 0;
+Array.from(document.querySelectorAll('[data-review-id]')).slice(0, arguments[0]).forEach(node => {
+    const more = node.querySelector('button[aria-label="See more"]');
+    if (more) { more.click(); clicked++; }
+});
+return clicked;
+"""
+
+# True once none of the first arguments[0] reviews still shows a "See more" button
+_REVIEWS_EXPANDED_JS = """
+return !Array.from(document.querySelectorAll('[data-review-id]')).slice(0, arguments[0])
+    .some(node => node.querySelector('button[aria-label="See more"]'));
+"""
+
+# The first arguments[0] reviews as {author, rating, date, text, helpful_count}
+# in one round-trip
+_REVIEWS_JS = """
+const nodes = Array.from(document.querySelectorAll('[data-review-id]')).slice(0, arguments[0]);
+const textOf = (node, selector) => {
+    const el = node.querySelector(selector);
+    return el ? (el.innerText || '').trim() : '';
+};
+return nodes.map(node => {
+    const star = node.querySelector('[aria-label*="star"]');
+    const rating = ((star && star.getAttribute('aria-label')) || '').match(/\\d+/);
+    const helpful = node.querySelector('[aria-label*="helpful"]');
+    return {
+        author: textOf(node, '[aria-label*="Photo of"]'),
+        rating: rating ? rating[0] : '',
+        date: textOf(node, '.rsqaWe'),
+        text: textOf(node, '.wiI7pd'),
+        helpful_count: (helpful && helpful.getAttribute('aria-label')) || ''
+    };
+});
+"""
+
+# Scrollable panel holding the reviews (parent of the sort button), or null
+_REVIEWS_PANEL_JS = """
+const sort = document.querySelector('[data-value="Sort reviews"]');
+return sort ? sort.parentElement : null;
+"""
+
+_REVIEW_COUNT_JS = "return document.querySelectorAll('[data-review-id]').length;"
+
+_DAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# aria-label of the first element mentioning each day in arguments[0] within the
+# popular times section ({day: label}, days without one left out), or null
+# when the page has no such section
+_POPULAR_TIMES_JS = """
+const section = document.querySelector('[aria-label*="Popular times"]');
+if (!section) return null;
+const labels = {};
+for (const day of arguments[0]) {
+    const el = section.querySelector(`[aria-label*="${day}"]`);
+    if (el) labels[day] = el.getAttribute('aria-label');
+}
+return labels;
+"""
+
+# For each field in arguments[1] ({field: selector}), the trimmed text of the
+# selector's first match inside arguments[0], or ''
+_SCOPED_TEXT_JS = """
+const texts = {};
+for (const [field, selector] of Object.entries(arguments[1])) {
+    const el = arguments[0].querySelector(selector);
+    texts[field] = el ? (el.innerText || '').trim() : '';
+}
+return texts;
+"""
+
+# Fields of a menu item and of a Q&A item, by selector within the item
+_MENU_ITEM_SELECTORS = {
+    'name': '.section-layout-title',
+    'price': '.section-layout-price',
+    'description': '.section-layout-description'
+}
+_QA_ITEM_SELECTORS = {
+    'question': '.section-layout-question',
+    'answer': '.section-layout-answer'
+}
+
+# Business URLs whose basic data is kept for repeat visits
+_DETAILS_CACHE_SIZE = 256
+
 
 class AdvancedGoogleBusinessScraper(GoogleBusinessScraper):
     """
@@ -23,14 +111,49 @@ class AdvancedGoogleBusinessScraper(GoogleBusinessScraper):
     
     def __init__(self, headless: bool = False, timeout: int = 15):
         super().__init__(headless, timeout)
+        # Basic sidebar data per business URL, oldest first, for repeat visits
+        self._details_cache: Dict[str, Dict] = {}
     
-    def extract_business_reviews(self, url: str, max_reviews: int = 10) -> List[Dict]:
+    def _business_details(self, url: str) -> Dict:
+        """Basic data of the loaded business page, parsed once per URL."""
+        details = self._details_cache.get(url)
+        if details is None:
+            details = self._extract_detailed_data_from_sidebar()
+            if details:
+                self._details_cache[url] = details
+                if len(self._details_cache) > _DETAILS_CACHE_SIZE:
+                    del self._details_cache[next(iter(self._details_cache))]
+        # Copied, since the advanced sections are added to it per call
+        return dict(details)
+    
+    def _ensure_on(self, url: str, reload: bool = False):
+        """
+        Load a business page, unless it is already open, and wait for its sidebar.
+        
+        reload forces a fresh load, e.g. to get back to the overview after a tab was opened.
+        """
+        if reload or self.driver.current_url != url:
+            self.driver.get(url)
+        WebDriverWait(self.driver, self.timeout, poll_frequency=0.1).until(
+            lambda d: d.execute_script(_SIDEBAR_LOADED_JS, _SIDEBAR_LOADED_SELECTORS, _SIDEBAR_TITLE_SELECTORS)
+        )
+    
+    def _wait_for_section(self, selector: str, timeout: int = 5):
+        """Wait until a section opened by a click has rendered, giving up quietly after `timeout` seconds."""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            )
+        except TimeoutException:
+            pass
+    
+    def extract_business_reviews(self, url: str, max_reviews: int = 10, already_loaded: bool = False) -> List[Dict]:
         """Extract reviews from a business page."""
         reviews = []
         
         try:
-            self.driver.get(url)
-            time.sleep(3)
+            if not already_loaded:
+                self._ensure_on(url)
             
             # Click on reviews tab
             try:
@@ -38,7 +161,7 @@ class AdvancedGoogleBusinessScraper(GoogleBusinessScraper):
                     EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[data-value="Sort reviews"]'))
                 )
                 reviews_button.click()
-                time.sleep(2)
+                self._wait_for_section('[data-review-id]')
             except TimeoutException:
                 self.logger.warning("Could not find reviews section")
                 return reviews
@@ -46,162 +169,115 @@ class AdvancedGoogleBusinessScraper(GoogleBusinessScraper):
             # Scroll to load more reviews
             self._scroll_reviews(max_reviews)
             
-            # Extract individual reviews
-            review_elements = self.driver.find_elements(By.CSS_SELECTOR, '[data-review-id]')
+            # Expand truncated reviews and wait for the full text before reading it
+            self._expand_reviews(max_reviews)
             
-            for element in review_elements[:max_reviews]:
-                try:
-                    review_data = {
-                        'author': self._safe_extract_text_from_element(element, '[aria-label*="Photo of"]'),
-                        'rating': self._extract_review_rating(element),
-                        'date': self._safe_extract_text_from_element(element, '.rsqaWe'),
-                        'text': self._extract_review_text(element),
-                        'helpful_count': self._extract_helpful_count(element)
-                    }
-                    reviews.append(review_data)
-                except Exception as e:
-                    self.logger.debug(f"Error extracting review: {str(e)}")
-                    continue
+            # Extract individual reviews, all in one script call
+            reviews = self.driver.execute_script(_REVIEWS_JS, max_reviews) or []
             
         except Exception as e:
             self.logger.error(f"Error extracting reviews: {str(e)}")
         
         return reviews
     
+    def _expand_reviews(self, max_reviews: int, timeout: int = 5):
+        """Expand the truncated reviews among the first max_reviews, giving up quietly after `timeout` seconds."""
+        if not self.driver.execute_script(_EXPAND_REVIEWS_JS, max_reviews):
+            return
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda d: d.execute_script(_REVIEWS_EXPANDED_JS, max_reviews)
+            )
+        except TimeoutException:
+            self.logger.debug("Some reviews did not expand; reading them as shown")
+    
     def _scroll_reviews(self, max_reviews: int):
         """Scroll the reviews section to load more reviews."""
         try:
-            reviews_container = self.driver.find_element(By.CSS_SELECTOR, '[data-value="Sort reviews"]')
-            parent = reviews_container.find_element(By.XPATH, './..')
+            parent = self.driver.execute_script(_REVIEWS_PANEL_JS)
+            if parent is None:
+                return
             
             last_count = 0
             scroll_attempts = 0
             max_scroll_attempts = max_reviews // 3
             
+            # The review count, once it exceeds last_count; counted in the page,
+            # so no element handles come back
+            def grown(driver):
+                count = driver.execute_script(_REVIEW_COUNT_JS)
+                return count if count > last_count else False
+            
             while scroll_attempts < max_scroll_attempts:
                 # Scroll down in the reviews container
                 self.driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", parent)
-                time.sleep(2)
                 
-                # Check if new reviews loaded
-                current_reviews = len(self.driver.find_elements(By.CSS_SELECTOR, '[data-review-id]'))
-                if current_reviews == last_count:
+                # Wait for new reviews; none within the timeout means the list is exhausted
+                try:
+                    last_count = WebDriverWait(self.driver, 5, poll_frequency=0.1).until(grown)
+                except TimeoutException:
                     break
                 
-                last_count = current_reviews
                 scroll_attempts += 1
                 
         except Exception as e:
             self.logger.debug(f"Error scrolling reviews: {str(e)}")
     
-    def _extract_review_rating(self, review_element) -> str:
-        """Extract rating from a review element."""
-        try:
-            rating_element = review_element.find_element(By.CSS_SELECTOR, '[aria-label*="star"]')
-            aria_label = rating_element.get_attribute('aria-label')
-            if aria_label:
-                import re
-                rating_match = re.search(r'(\d+)', aria_label)
-                return rating_match.group(1) if rating_match else ""
-        except NoSuchElementException:
-            pass
-        return ""
-    
-    def _extract_review_text(self, review_element) -> str:
-        """Extract review text, handling 'more' buttons."""
-        try:
-            # Try to click "more" button if present
-            try:
-                more_button = review_element.find_element(By.CSS_SELECTOR, 'button[aria-label="See more"]')
-                more_button.click()
-                time.sleep(1)
-            except NoSuchElementException:
-                pass
-            
-            # Extract the review text
-            text_element = review_element.find_element(By.CSS_SELECTOR, '.wiI7pd')
-            return text_element.text.strip()
-        except NoSuchElementException:
-            return ""
-    
-    def _extract_helpful_count(self, review_element) -> str:
-        """Extract helpful count from review."""
-        try:
-            helpful_element = review_element.find_element(By.CSS_SELECTOR, '[aria-label*="helpful"]')
-            return helpful_element.get_attribute('aria-label') or ""
-        except NoSuchElementException:
-            return ""
-    
-    def _safe_extract_text_from_element(self, parent_element, selector: str) -> str:
-        """Safely extract text from an element within a parent element."""
+    def _safe_extract_texts_from_element(self, parent_element, selectors: Dict[str, str]) -> Dict[str, str]:
+        """Safely extract the text of several elements within a parent element."""
+        # Every field's lookup and text read in one round-trip, with no exception on a miss
         try:
-            element = parent_element.find_element(By.CSS_SELECTOR, selector)
-            return element.text.strip()
-        except NoSuchElementException:
-            return ""
+            return self.driver.execute_script(_SCOPED_TEXT_JS, parent_element, selectors) or {}
+        except JavascriptException:
+            return {}
     
-    def extract_popular_times(self, url: str) -> Dict:
+    def extract_popular_times(self, url: str, already_loaded: bool = False) -> Dict:
         """Extract popular times data from business page."""
         popular_times = {}
         
         try:
-            self.driver.get(url)
-            time.sleep(3)
+            if not already_loaded:
+                self._ensure_on(url)
             
-            # Look for popular times section
-            try:
-                popular_times_section = self.driver.find_element(
-                    By.CSS_SELECTOR, '[aria-label*="Popular times"]'
-                )
-                
-                # Extract day-by-day data
-                days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-                
-                for day in days:
-                    try:
-                        day_element = popular_times_section.find_element(
-                            By.CSS_SELECTOR, f'[aria-label*="{day}"]'
-                        )
-                        popular_times[day] = day_element.get_attribute('aria-label')
-                    except NoSuchElementException:
-                        popular_times[day] = "No data"
-                        
-            except NoSuchElementException:
+            # Look for popular times section, probing every day in one script call
+            labels = self.driver.execute_script(_POPULAR_TIMES_JS, _DAYS)
+            if labels is None:
                 self.logger.debug("Popular times section not found")
-                
+            else:
+                for day in _DAYS:
+                    popular_times[day] = labels.get(day) or "No data"
+            
         except Exception as e:
             self.logger.error(f"Error extracting popular times: {str(e)}")
         
         return popular_times
     
-    def extract_menu_info(self, url: str) -> List[Dict]:
+    def extract_menu_info(self, url: str, already_loaded: bool = False) -> List[Dict]:
         """Extract menu information if available."""
         menu_items = []
         
         try:
-            self.driver.get(url)
-            time.sleep(3)
+            if not already_loaded:
+                self._ensure_on(url)
             
             # Look for menu section
             try:
                 menu_button = self.driver.find_element(By.CSS_SELECTOR, 'button[aria-label*="Menu"]')
                 menu_button.click()
-                time.sleep(2)
+                self._wait_for_section('.section-layout-flex-vertical')
                 
                 # Extract menu items
                 menu_elements = self.driver.find_elements(By.CSS_SELECTOR, '.section-layout-flex-vertical')
                 
                 for element in menu_elements:
                     try:
-                        item_name = self._safe_extract_text_from_element(element, '.section-layout-title')
-                        item_price = self._safe_extract_text_from_element(element, '.section-layout-price')
-                        item_description = self._safe_extract_text_from_element(element, '.section-layout-description')
+                        item = self._safe_extract_texts_from_element(element, _MENU_ITEM_SELECTORS)
                         
-                        if item_name:
+                        if item.get('name'):
                             menu_items.append({
-                                'name': item_name,
-                                'price': item_price,
-                                'description': item_description
+                                'name': item['name'],
+                                'price': item.get('price', ''),
+                                'description': item.get('description', '')
                             })
                     except Exception as e:
                         self.logger.debug(f"Error extracting menu item: {str(e)}")
@@ -215,32 +291,31 @@ class AdvancedGoogleBusinessScraper(GoogleBusinessScraper):
         
         return menu_items
     
-    def extract_qa_section(self, url: str) -> List[Dict]:
+    def extract_qa_section(self, url: str, already_loaded: bool = False) -> List[Dict]:
         """Extract Q&A section data."""
         qa_data = []
         
         try:
-            self.driver.get(url)
-            time.sleep(3)
+            if not already_loaded:
+                self._ensure_on(url)
             
             # Look for Q&A section
             try:
                 qa_button = self.driver.find_element(By.CSS_SELECTOR, 'button[aria-label*="Questions"]')
                 qa_button.click()
-                time.sleep(2)
+                self._wait_for_section('.section-layout-root')
                 
                 # Extract Q&A items
                 qa_elements = self.driver.find_elements(By.CSS_SELECTOR, '.section-layout-root')
                 
                 for element in qa_elements:
                     try:
-                        question = self._safe_extract_text_from_element(element, '.section-layout-question')
-                        answer = self._safe_extract_text_from_element(element, '.section-layout-answer')
+                        item = self._safe_extract_texts_from_element(element, _QA_ITEM_SELECTORS)
                         
-                        if question:
+                        if item.get('question'):
                             qa_data.append({
-                                'question': question,
-                                'answer': answer
+                                'question': item['question'],
+                                'answer': item.get('answer', '')
                             })
                     except Exception as e:
                         self.logger.debug(f"Error extracting Q&A item: {str(e)}")
@@ -268,30 +343,51 @@ class AdvancedGoogleBusinessScraper(GoogleBusinessScraper):
         Returns:
             Dict: Comprehensive business data
         """
-        # Get basic business data
-        business_data = self._extract_business_details(url)
+        # Load the page once; the basic data and every section below are read from it
+        try:
+            self._ensure_on(url)
+        except Exception as e:
+            self.logger.error(f"Could not load business page: {str(e)}")
+            return {}
+        business_data = self._business_details(url)
         
         if not business_data:
             return {}
         
-        # Add advanced features
+        # Add advanced features; popular times are read first, from the overview.
+        # Reviews, menu and Q&A each switch the panel to their own tab, so the
+        # overview is reloaded before every tab after the first
         try:
+            popular_times = self.extract_popular_times(url, already_loaded=True)
+            tab_opened = False
+            
             if include_reviews:
                 self.logger.info(f"Extracting reviews for {business_data.get('name', 'Unknown')}")
-                business_data['reviews'] = self.extract_business_reviews(url, max_reviews)
+                business_data['reviews'] = self.extract_business_reviews(url, max_reviews, already_loaded=True)
+                tab_opened = True
             
             if include_menu:
                 self.logger.info(f"Extracting menu for {business_data.get('name', 'Unknown')}")
-                business_data['menu'] = self.extract_menu_info(url)
+                if tab_opened:
+                    self._ensure_on(url, reload=True)
+                business_data['menu'] = self.extract_menu_info(url, already_loaded=True)
+                tab_opened = True
             
             # Always try to get popular times and Q&A
-            business_data['popular_times'] = self.extract_popular_times(url)
-            business_data['qa'] = self.extract_qa_section(url)
+            business_data['popular_times'] = popular_times
+            if tab_opened:
+                self._ensure_on(url, reload=True)
+            business_data['qa'] = self.extract_qa_section(url, already_loaded=True)
             
         except Exception as e:
             self.logger.error(f"Error extracting advanced data: {str(e)}")
         
         return business_data
+    
+    def close(self):
+        """Drop the per-URL details cache and release the browser."""
+        self._details_cache.clear()
+        super().close()
 
 
 def main():
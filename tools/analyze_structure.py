@@ -2,79 +2,160 @@
 Page structure analyzer to understand current Google Maps HTML
 """
 
+import os
+import sys
 from google_business_scraper import GoogleBusinessScraper
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
 import time
 
+DEFAULT_URL = "https://www.google.com/maps/place/Starbucks+Reserve+Roastery+New+York"
+
+# Element groups to inspect, as one CSS selector list per group or an
+# ('xpath', expression) pair where one XPath covers several substring tests
+SELECTORS = {
+    'h1': 'h1',
+    'rating': ('xpath', "//*[contains(@aria-label,'star') or contains(@aria-label,'rating')"
+                        " or contains(concat(' ',@class,' '),' F7nice ')]"),
+    'address': "[aria-label*='address'], [aria-label*='directions'], button[data-value='Directions']",
+    'phone': "[aria-label*='phone'], [aria-label*='call'], a[href^='tel:']",
+    'data': '[data-item-id], [data-value]'
+}
+
+# How many elements of each group are printed; groups not listed print them all
+SHOWN = {'rating': 5, 'address': 5, 'phone': 5, 'data': 10}
+
+# For each group in arguments[0], its match count and the first arguments[1][group]
+# elements with the attributes printed for them; missing attributes come back as
+# null (printed as None, like get_attribute)
+STRUCTURE_JS = """
+const xpathAll = expr => {
+    const snapshot = document.evaluate(expr, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    return Array.from({length: snapshot.snapshotLength}, (_, i) => snapshot.snapshotItem(i));
+};
+return Object.fromEntries(Object.entries(arguments[0]).map(([group, selector]) => {
+    const found = Array.from(Array.isArray(selector) ? xpathAll(selector[1]) : document.querySelectorAll(selector));
+    return [group, {
+        count: found.length,
+        items: found.slice(0, arguments[1][group] ?? found.length).map(e => ({
+            text: (e.innerText || '').trim(),
+            cls: e.getAttribute('class'),
+            aria: e.getAttribute('aria-label'),
+            href: e.href === undefined ? e.getAttribute('href') : e.href,
+            itemId: e.getAttribute('data-item-id'),
+            value: e.getAttribute('data-value')
+        }))
+    }];
+}));
+"""
+
+def print_structure(page, title):
+    """Print the element groups collected by STRUCTURE_JS or analyze_saved."""
+    print("\n" + "="*50)
+    print("ANALYZING PAGE STRUCTURE")
+    print("="*50)
+    
+    # Try to find all h1 elements
+    h1_elements = page['h1']
+    print(f"\nFound {h1_elements['count']} h1 elements:")
+    for i, h1 in enumerate(h1_elements['items']):
+        text = h1['text']
+        if text:
+            print(f"  h1[{i}]: '{text}' (class: {h1['cls']})")
+    
+    # Try to find elements that might contain rating
+    rating_elements = page['rating']
+    print(f"\nFound {rating_elements['count']} potential rating elements:")
+    for i, elem in enumerate(rating_elements['items']):
+        print(f"  rating[{i}]: text='{elem['text']}' aria-label='{elem['aria']}' class='{elem['cls']}'")
+    
+    # Try to find elements that might contain address
+    address_elements = page['address']
+    print(f"\nFound {address_elements['count']} potential address elements:")
+    for i, elem in enumerate(address_elements['items']):
+        print(f"  address[{i}]: text='{elem['text']}' aria-label='{elem['aria']}' class='{elem['cls']}'")
+    
+    # Look for phone elements
+    phone_elements = page['phone']
+    print(f"\nFound {phone_elements['count']} potential phone elements:")
+    for i, elem in enumerate(phone_elements['items']):
+        print(f"  phone[{i}]: text='{elem['text']}' aria-label='{elem['aria']}' href='{elem['href']}' class='{elem['cls']}'")
+    
+    # Get page title
+    print(f"\nPage title: {title}")
+    
+    # Look for specific data structures
+    print(f"\nSearching for data-* attributes...")
+    data_elements = page['data']
+    print(f"Found {data_elements['count']} elements with data attributes:")
+    for i, elem in enumerate(data_elements['items']):
+        data_item_id = elem['itemId']
+        data_value = elem['value']
+        text = elem['text'][:50]  # First 50 chars
+        if data_item_id or data_value:
+            print(f"  data[{i}]: data-item-id='{data_item_id}' data-value='{data_value}' text='{text}'")
+    
+    print(f"\n" + "="*50)
+    print("ANALYSIS COMPLETE")
+    print("="*50)
+
+
+def capture_page(url=DEFAULT_URL, html_path="page.html"):
+    """Render a page once in Chrome and save its HTML for analyze_saved."""
+    scraper = GoogleBusinessScraper(headless=True, timeout=20)
+    
+    try:
+        print(f"Capturing {url} to {html_path}")
+        scraper.driver.get(url)
+        time.sleep(5)
+        
+        with open(html_path, 'w', encoding='utf-8') as f:
+            f.write(scraper.driver.page_source)
+    finally:
+        scraper.close()
+
+
+def analyze_saved(html_path="page.html"):
+    """Run the structure analysis offline against a page saved by capture_page."""
+    with open(html_path, 'rb') as f:
+        tree = lxml_html.fromstring(f.read())
+    
+    # Same shape as STRUCTURE_JS; text_content stands in for innerText and
+    # hrefs are the raw attribute since there is no base URL to resolve against
+    page = {}
+    for group, selector in SELECTORS.items():
+        found = tree.xpath(selector[1]) if isinstance(selector, tuple) else CSSSelector(selector)(tree)
+        page[group] = {
+            'count': len(found),
+            'items': [{
+                'text': e.text_content().strip(),
+                'cls': e.get('class'),
+                'aria': e.get('aria-label'),
+                'href': e.get('href'),
+                'itemId': e.get('data-item-id'),
+                'value': e.get('data-value')
+            } for e in found[:SHOWN.get(group)]]
+        }
+    
+    print_structure(page, tree.findtext('.//title'))
+
+
 def analyze_page_structure():
     """Analyze the current Google Maps page structure to understand selectors"""
     scraper = GoogleBusinessScraper(headless=False, timeout=20)
     
     try:
         # Go to a specific business page
-        url = "https://www.google.com/maps/place/Starbucks+Reserve+Roastery+New+York"
+        url = DEFAULT_URL
         print(f"Analyzing page structure for: {url}")
         
         scraper.driver.get(url)
         time.sleep(5)
         
-        print("\n" + "="*50)
-        print("ANALYZING PAGE STRUCTURE")
-        print("="*50)
-        
-        # Try to find all h1 elements
-        h1_elements = scraper.driver.find_elements("css selector", "h1")
-        print(f"\nFound {len(h1_elements)} h1 elements:")
-        for i, h1 in enumerate(h1_elements):
-            text = h1.text.strip()
-            if text:
-                print(f"  h1[{i}]: '{text}' (class: {h1.get_attribute('class')})")
-        
-        # Try to find elements that might contain rating
-        rating_elements = scraper.driver.find_elements("css selector", "[aria-label*='star'], [aria-label*='rating'], .F7nice")
-        print(f"\nFound {len(rating_elements)} potential rating elements:")
-        for i, elem in enumerate(rating_elements[:5]):  # Limit to first 5
-            text = elem.text.strip()
-            aria_label = elem.get_attribute('aria-label')
-            class_name = elem.get_attribute('class')
-            print(f"  rating[{i}]: text='{text}' aria-label='{aria_label}' class='{class_name}'")
-        
-        # Try to find elements that might contain address
-        address_elements = scraper.driver.find_elements("css selector", "[aria-label*='address'], [aria-label*='directions'], button[data-value='Directions']")
-        print(f"\nFound {len(address_elements)} potential address elements:")
-        for i, elem in enumerate(address_elements[:5]):
-            text = elem.text.strip()
-            aria_label = elem.get_attribute('aria-label')
-            class_name = elem.get_attribute('class')
-            print(f"  address[{i}]: text='{text}' aria-label='{aria_label}' class='{class_name}'")
-        
-        # Look for phone elements
-        phone_elements = scraper.driver.find_elements("css selector", "[aria-label*='phone'], [aria-label*='call'], a[href^='tel:']")
-        print(f"\nFound {len(phone_elements)} potential phone elements:")
-        for i, elem in enumerate(phone_elements[:5]):
-            text = elem.text.strip()
-            aria_label = elem.get_attribute('aria-label')
-            href = elem.get_attribute('href')
-            class_name = elem.get_attribute('class')
-            print(f"  phone[{i}]: text='{text}' aria-label='{aria_label}' href='{href}' class='{class_name}'")
-        
-        # Get page title
-        title = scraper.driver.title
-        print(f"\nPage title: {title}")
-        
-        # Look for specific data structures
-        print(f"\nSearching for data-* attributes...")
-        data_elements = scraper.driver.find_elements("css selector", "[data-item-id], [data-value]")
-        print(f"Found {len(data_elements)} elements with data attributes:")
-        for i, elem in enumerate(data_elements[:10]):  # Limit to first 10
-            data_item_id = elem.get_attribute('data-item-id')
-            data_value = elem.get_attribute('data-value')
-            text = elem.text.strip()[:50]  # First 50 chars
-            if data_item_id or data_value:
-                print(f"  data[{i}]: data-item-id='{data_item_id}' data-value='{data_value}' text='{text}'")
-        
-        print(f"\n" + "="*50)
-        print("ANALYSIS COMPLETE")
-        print("="*50)
+        # Every element group and its attributes in one script call, instead of
+        # a find_elements call per group and a call per attribute read
+        page = scraper.driver.execute_script(STRUCTURE_JS, SELECTORS, SHOWN)
+        print_structure(page, scraper.driver.title)
         
     except Exception as e:
         print(f"Error during analysis: {str(e)}")
@@ -85,4 +166,11 @@ def analyze_page_structure():
         scraper.close()
 
 if __name__ == "__main__":
-    analyze_page_structure()
+    # --static [page.html]: analyze a saved snapshot, capturing it first if it is missing
+    if len(sys.argv) > 1 and sys.argv[1] == '--static':
+        html_path = sys.argv[2] if len(sys.argv) > 2 else "page.html"
+        if not os.path.exists(html_path):
+            capture_page(html_path=html_path)
+        analyze_saved(html_path)
+    else:
+        analyze_page_structure()
@@ -33,7 +33,9 @@ MAX_IMAGES_PER_BUSINESS = 5
 EXTRACT_REVIEWS = False  # Set to True to extract review text (slower)
 EXTRACT_POPULAR_TIMES = False  # Set to True to extract popular times data
 
-# Selectors (can be updated if Google changes their HTML structure)
+# Selectors (can be updated if Google changes their HTML structure).
+# Plain strings are CSS; (strategy, selector) tuples name their strategy and
+# can be passed straight on as driver.find_elements(*selector)
 SELECTORS = {
     'search_results': '[data-value="Search results"]',
     'business_name': 'h1',
@@ -42,6 +44,6 @@ SELECTORS = {
     'address': '[data-item-id="address"]',
     'phone': '[data-item-id="phone"]',
     'website': '[data-item-id="authority"]',
-    'hours': '[aria-label*="hours"]',
+    'hours': ("xpath", "//*[contains(@aria-label,'hours') or contains(@aria-label,'Hours')]"),
     'category': '[data-value="Category"]'
 }
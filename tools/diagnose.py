@@ -4,12 +4,31 @@ Diagnostic script to check Chrome and WebDriver setup
 
 import sys
 import os
+import io
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 
+def get_chrome_version_from_registry():
+    """Chrome version recorded by its updater in the Windows registry, or None"""
+    try:
+        import winreg
+    except ImportError:
+        return None
+    
+    for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+        try:
+            with winreg.OpenKey(hive, r"Software\Google\Chrome\BLBeacon") as key:
+                version, _ = winreg.QueryValueEx(key, "version")
+                return version
+        except OSError:
+            continue
+    return None
+
 def check_chrome_installation():
     """Check if Chrome is installed and get version"""
     print("Checking Chrome installation...")
@@ -27,9 +46,14 @@ def check_chrome_installation():
             print(f"✓ Chrome found at: {path}")
             chrome_found = True
             
-            # Try to get version
+            # Try to get version, from the registry first so Chrome is not launched
+            version = get_chrome_version_from_registry()
+            if version:
+                print(f"✓ Chrome version: {version}")
+                break
             try:
-                result = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10)
+                result = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10,
+                                        creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0))
                 if result.returncode == 0:
                     print(f"✓ Chrome version: {result.stdout.strip()}")
                 else:
@@ -83,6 +107,14 @@ def test_basic_webdriver():
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--disable-gpu')
         
+        # Only the title is checked, so skip images and stop waiting once the DOM is ready
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2
+        })
+        options.page_load_strategy = 'eager'
+        
         # Use a fresh ChromeDriver
         print("Creating WebDriver instance...")
         driver_path = ChromeDriverManager(cache_valid_range=1).install()
@@ -133,6 +165,42 @@ def clear_webdriver_cache():
         print(f"⚠ Could not clear cache: {e}")
         return False
 
+class _PerThreadOutput(io.TextIOBase):
+    """Stand-in for sys.stdout that collects each worker thread's prints separately"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.buffers = {}
+    
+    def write(self, text):
+        buffer = self.buffers.get(threading.get_ident())
+        return (buffer if buffer is not None else self.stream).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+
+def run_concurrently(*checks):
+    """Run independent checks in parallel; print their output in order and return their results"""
+    output = _PerThreadOutput(sys.stdout)
+    
+    def run(check):
+        buffer = output.buffers[threading.get_ident()] = io.StringIO()
+        try:
+            return check(), buffer
+        finally:
+            del output.buffers[threading.get_ident()]
+    
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            runs = list(executor.map(run, checks))
+    finally:
+        sys.stdout = output.stream
+    
+    for _, buffer in runs:
+        print(buffer.getvalue(), end='')
+    return [result for result, _ in runs]
+
 def main():
     """Run all diagnostic checks"""
     print("Chrome and WebDriver Diagnostic Tool")
@@ -141,15 +209,15 @@ def main():
     checks_passed = 0
     total_checks = 3
     
-    # Check Chrome installation
-    if check_chrome_installation():
-        checks_passed += 1
-    
     # Clear cache first
     clear_webdriver_cache()
     
-    # Test WebDriver Manager
-    if test_webdriver_manager():
+    # Check Chrome installation and test WebDriver Manager side by side; both
+    # just wait on disk, processes or the network
+    chrome_ok, manager_ok = run_concurrently(check_chrome_installation, test_webdriver_manager)
+    if chrome_ok:
+        checks_passed += 1
+    if manager_ok:
         checks_passed += 1
     
     # Test basic WebDriver
@@ -2,12 +2,13 @@
 Quick test script to verify data extraction is working
 """
 
-from google_business_scraper import GoogleBusinessScraper
+from _shared_driver import get_shared_scraper
 import time
 
 def test_single_business():
     """Test data extraction on a single known business"""
-    scraper = GoogleBusinessScraper(headless=False, timeout=20)
+    # Shared with the other test scripts run in this process; closed at exit
+    scraper = get_shared_scraper()
     
     try:
         # Test with a well-known business
@@ -44,9 +45,6 @@ def test_single_business():
     
     except Exception as e:
         print(f"❌ Error: {str(e)}")
-    
-    finally:
-        scraper.close()
 
 if __name__ == "__main__":
     test_single_business()
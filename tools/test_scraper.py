@@ -3,21 +3,76 @@ Simple test script with fixed ChromeDriver path
 """
 
 import os
-import glob
-from google_business_scraper import GoogleBusinessScraper
+import json
+from packaging.version import InvalidVersion, parse as parse_version
+from _shared_driver import get_shared_scraper
+
+# ChromeDriver found on an earlier run; lives in the webdriver_manager cache so
+# clearing that (as diagnose.py does) clears it too
+WDM_DIR = os.path.expanduser(os.path.join("~", ".wdm"))
+DRIVER_CACHE_FILE = os.path.join(WDM_DIR, "scraper_driver_cache.json")
+
+def _wdm_stamp():
+    """Modification time of webdriver_manager's metadata file, which changes on every install"""
+    try:
+        return os.path.getmtime(os.path.join(WDM_DIR, "drivers.json"))
+    except OSError:
+        return None
+
+def read_cached_driver_path():
+    """Cached ChromeDriver path if nothing was installed since and it still exists"""
+    try:
+        with open(DRIVER_CACHE_FILE, encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    path = cached.get('path')
+    if cached.get('wdm_stamp') == _wdm_stamp() and path and os.path.isfile(path):
+        return path
+    return None
+
+def write_cached_driver_path(path):
+    """Remember a ChromeDriver path for the next run"""
+    try:
+        with open(DRIVER_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'wdm_stamp': _wdm_stamp(), 'path': path}, f)
+    except OSError:
+        pass
 
 def find_chromedriver():
     """Find the correct ChromeDriver executable"""
-    # Search for chromedriver.exe in the .wdm directory
-    wdm_base = os.path.expanduser("~/.wdm")
-    pattern = os.path.join(wdm_base, "drivers", "chromedriver", "**", "chromedriver.exe")
+    # A path found on an earlier run skips the scan until webdriver_manager installs again
+    cached = read_cached_driver_path()
+    if cached:
+        return cached
+    
+    # webdriver-manager installs to drivers/chromedriver/<platform>/<version>/...,
+    # so only the version directories are listed and just one of them is walked
+    base = os.path.expanduser(os.path.join("~", ".wdm", "drivers", "chromedriver"))
+    if not os.path.isdir(base):
+        return None
     
-    chrome_drivers = glob.glob(pattern, recursive=True)
+    versions = []
+    for platform in os.listdir(base):
+        platform_dir = os.path.join(base, platform)
+        if not os.path.isdir(platform_dir):
+            continue
+        for version in os.listdir(platform_dir):
+            try:
+                # Parsed, not compared as strings, so 120.x sorts above 99.x
+                versions.append((parse_version(version), os.path.join(platform_dir, version)))
+            except InvalidVersion:
+                continue
     
-    if chrome_drivers:
-        # Return the most recent one (highest version number)
-        chrome_drivers.sort(reverse=True)
-        return chrome_drivers[0]
+    # Newest version first; an install without chromedriver.exe falls through to the next
+    for _, version_dir in sorted(versions, reverse=True):
+        driver_path = next((os.path.join(dirpath, "chromedriver.exe")
+                            for dirpath, _, filenames in os.walk(version_dir)
+                            if "chromedriver.exe" in filenames), None)
+        if driver_path:
+            write_cached_driver_path(driver_path)
+            return driver_path
     
     return None
 
@@ -43,7 +98,7 @@ def test_scraper_simple():
     
     try:
         print("Testing Google Business Scraper...")
-        scraper = GoogleBusinessScraper(headless=True, timeout=15)  # Use headless for initial test
+        scraper = get_shared_scraper()  # Headless, see _shared_driver.SCRAPER_OPTIONS
         
         print("Searching for coffee shops...")
         businesses = scraper.search_businesses(
@@ -58,7 +113,6 @@ def test_scraper_simple():
             print(f"   Rating: {business.get('rating', 'N/A')}")
             print(f"   Address: {business.get('address', 'N/A')}")
         
-        scraper.close()
         print("\n✓ Test completed successfully!")
         
         if businesses:
@@ -5,8 +5,30 @@ Utility functions for the Google Business Scraper
 import re
 import json
 import csv
-from typing import List, Dict, Any, Optional
-import pandas as pd
+import heapq
+from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Dict, Any, Iterator, Optional
+
+# Optional C JSON encoder for save_report_to_file; the stdlib encoder is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional incremental JSON parser for stream_businesses; json.load is the fallback
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Patterns used by the cleaning helpers, compiled once at import
+_PHONE_STRIP_RE = re.compile(r'[^\d+\-\(\)\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_FLOAT_RE = re.compile(r'(\d+\.?\d*)')
+_INT_RE = re.compile(r'(\d+)')
+_COMMA_TABLE = str.maketrans('', '', ',')
 
 
 def clean_phone_number(phone: str) -> str:
@@ -15,14 +37,15 @@ def clean_phone_number(phone: str) -> str:
         return ""
     
     # Remove all non-digit characters except + and -
-    cleaned = re.sub(r'[^\d+\-\(\)\s]', '', phone)
+    cleaned = _PHONE_STRIP_RE.sub('', phone)
     
     # Remove extra spaces
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+    cleaned = _WHITESPACE_RE.sub(' ', cleaned).strip()
     
     return cleaned
 
 
+@lru_cache(maxsize=4096)
 def clean_rating(rating: str) -> float:
     """Convert rating string to float."""
     if not rating:
@@ -30,12 +53,13 @@ def clean_rating(rating: str) -> float:
     
     try:
         # Extract numeric value
-        match = re.search(r'(\d+\.?\d*)', rating)
+        match = _FLOAT_RE.search(rating)
         return float(match.group(1)) if match else 0.0
     except (ValueError, AttributeError):
         return 0.0
 
 
+@lru_cache(maxsize=4096)
 def clean_reviews_count(reviews: str) -> int:
     """Extract number of reviews as integer."""
     if not reviews:
@@ -43,7 +67,7 @@ def clean_reviews_count(reviews: str) -> int:
     
     try:
         # Extract number from strings like "(123)" or "123 reviews"
-        match = re.search(r'(\d+)', reviews.replace(',', ''))
+        match = _INT_RE.search(reviews.translate(_COMMA_TABLE))
         return int(match.group(1)) if match else 0
     except (ValueError, AttributeError):
         return 0
@@ -71,6 +95,7 @@ def parse_business_hours(hours_text: str) -> Dict[str, str]:
     return hours_dict
 
 
+@lru_cache(maxsize=4096)
 def extract_price_level(price_text: str) -> int:
     """Convert price range symbols to numeric level (1-4)."""
     if not price_text:
@@ -104,14 +129,14 @@ def merge_business_data(businesses: List[Dict]) -> List[Dict]:
     merged = []
     
     for business in businesses:
-        key = f"{business.get('name', '')}-{business.get('address', '')}"
+        # A tuple key cannot collide the way "name-address" strings could
+        key = (business.get('name', ''), business.get('address', ''))
         
-        if key not in seen:
-            seen[key] = business
+        existing = seen.setdefault(key, business)
+        if existing is business:
             merged.append(business)
         else:
             # Merge additional data
-            existing = seen[key]
             for k, v in business.items():
                 if not existing.get(k) and v:
                     existing[k] = v
@@ -121,37 +146,36 @@ def merge_business_data(businesses: List[Dict]) -> List[Dict]:
 
 def filter_businesses(businesses: List[Dict], filters: Dict) -> List[Dict]:
     """Filter businesses based on criteria."""
+    # Filter values are read and lower-cased once; None means "not filtered on"
+    min_rating = filters.get('min_rating')
+    min_reviews = filters.get('min_reviews')
+    categories = [cat.lower() for cat in filters['categories']] if 'categories' in filters else None
+    location_keywords = [keyword.lower() for keyword in filters['location_keywords']] if 'location_keywords' in filters else None
+    
     filtered = []
     
     for business in businesses:
-        include = True
-        
         # Rating filter
-        if 'min_rating' in filters:
-            rating = clean_rating(business.get('rating', ''))
-            if rating < filters['min_rating']:
-                include = False
+        if min_rating is not None and clean_rating(business.get('rating', '')) < min_rating:
+            continue
         
         # Reviews count filter
-        if 'min_reviews' in filters and include:
-            reviews = clean_reviews_count(business.get('reviews_count', ''))
-            if reviews < filters['min_reviews']:
-                include = False
+        if min_reviews is not None and clean_reviews_count(business.get('reviews_count', '')) < min_reviews:
+            continue
         
         # Category filter
-        if 'categories' in filters and include:
+        if categories is not None:
             category = business.get('category', '').lower()
-            if not any(cat.lower() in category for cat in filters['categories']):
-                include = False
+            if not any(cat in category for cat in categories):
+                continue
         
         # Location filter
-        if 'location_keywords' in filters and include:
+        if location_keywords is not None:
             address = business.get('address', '').lower()
-            if not any(keyword.lower() in address for keyword in filters['location_keywords']):
-                include = False
+            if not any(keyword in address for keyword in location_keywords):
+                continue
         
-        if include:
-            filtered.append(business)
+        filtered.append(business)
     
     return filtered
 
@@ -161,6 +185,9 @@ def export_to_excel(businesses: List[Dict], filename: str):
     if not businesses:
         return
     
+    # Only this export needs pandas; importing it here keeps the helpers above fast to load
+    import pandas as pd
+    
     try:
         # Main data sheet
         df_main = pd.DataFrame(businesses)
@@ -169,7 +196,10 @@ def export_to_excel(businesses: List[Dict], filename: str):
         summary_data = {
             'Total Businesses': len(businesses),
             'Businesses with Ratings': len([b for b in businesses if b.get('rating')]),
-            'Average Rating': df_main['rating'].apply(clean_rating).mean(),
+            # Vectorised clean_rating: first number in each rating, 0 where there is none
+            'Average Rating': (df_main['rating'].fillna('').astype(str)
+                               .str.extract(_FLOAT_RE, expand=False)
+                               .astype(float).fillna(0.0).mean()),
             'Businesses with Phone': len([b for b in businesses if b.get('phone')]),
             'Businesses with Website': len([b for b in businesses if b.get('website')]),
         }
@@ -177,7 +207,10 @@ def export_to_excel(businesses: List[Dict], filename: str):
         df_summary = pd.DataFrame([summary_data])
         
         # Write to Excel with multiple sheets
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+        # xlsxwriter only writes (no workbook model to keep editable), which makes it the
+        # faster engine; constant_memory is left off because pandas writes cells
+        # column by column and that mode drops cells outside the current row
+        with pd.ExcelWriter(filename, engine='xlsxwriter') as writer:
             df_main.to_excel(writer, sheet_name='Businesses', index=False)
             df_summary.to_excel(writer, sheet_name='Summary', index=False)
         
@@ -205,20 +238,21 @@ def generate_report(businesses: List[Dict]) -> Dict:
         'most_reviewed': []
     }
     
-    ratings = []
+    # Each rating is cleaned once and reused for the average, the distribution
+    # and the top-rated list
+    rating_values = [clean_rating(business.get('rating', '')) for business in businesses]
+    ratings = [rating for business, rating in zip(businesses, rating_values) if business.get('rating')]
+    report['businesses_with_rating'] = len(ratings)
+    
+    # Rating distribution, bucketed in one C-level pass instead of per business
+    star_counts = Counter(map(int, ratings))
+    for stars in report['rating_distribution']:
+        report['rating_distribution'][stars] = star_counts[int(stars)]
+    
+    categories = Counter()
     
     for business in businesses:
         # Count businesses with data
-        if business.get('rating'):
-            report['businesses_with_rating'] += 1
-            rating = clean_rating(business.get('rating'))
-            ratings.append(rating)
-            
-            # Rating distribution
-            rating_int = int(rating) if rating > 0 else 0
-            if rating_int in range(1, 6):
-                report['rating_distribution'][str(rating_int)] += 1
-        
         if business.get('phone'):
             report['businesses_with_phone'] += 1
         
@@ -229,20 +263,21 @@ def generate_report(businesses: List[Dict]) -> Dict:
             report['businesses_with_hours'] += 1
         
         # Category distribution
-        category = business.get('category', 'Unknown')
-        report['categories'][category] = report['categories'].get(category, 0) + 1
+        categories[business.get('category', 'Unknown')] += 1
+    
+    report['categories'] = dict(categories)
     
     # Calculate average rating
     if ratings:
         report['average_rating'] = sum(ratings) / len(ratings)
     
-    # Top rated businesses (rating >= 4.5)
-    top_rated = [b for b in businesses if clean_rating(b.get('rating', '')) >= 4.5]
-    report['top_rated'] = sorted(top_rated, key=lambda x: clean_rating(x.get('rating', '')), reverse=True)[:10]
+    # Top rated businesses (rating >= 4.5); nlargest keeps input order among ties like a stable sort
+    top_rated = [(rating, business) for business, rating in zip(businesses, rating_values) if rating >= 4.5]
+    report['top_rated'] = [business for _, business in heapq.nlargest(10, top_rated, key=itemgetter(0))]
     
     # Most reviewed businesses
-    most_reviewed = [b for b in businesses if b.get('reviews_count')]
-    report['most_reviewed'] = sorted(most_reviewed, key=lambda x: clean_reviews_count(x.get('reviews_count', '')), reverse=True)[:10]
+    most_reviewed = [(clean_reviews_count(b['reviews_count']), b) for b in businesses if b.get('reviews_count')]
+    report['most_reviewed'] = [business for _, business in heapq.nlargest(10, most_reviewed, key=itemgetter(0))]
     
     return report
 
@@ -250,13 +285,40 @@ def generate_report(businesses: List[Dict]) -> Dict:
 def save_report_to_file(report: Dict, filename: str = "scraping_report.json"):
     """Save the generated report to a JSON file."""
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False, default=str)
         print(f"Report saved to {filename}")
     except Exception as e:
         print(f"Error saving report: {str(e)}")
 
 
+def stream_businesses(filename: str, prefix: str = 'item') -> Iterator[Any]:
+    """Yield the records of a saved JSON file one at a time.
+    
+    The default prefix matches the top-level list written by save_to_json; pass
+    e.g. 'top_rated.item' to walk a list inside a saved report.
+    """
+    if ijson is None:
+        with open(filename, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        # Follow the prefix by hand, 'item' meaning every element of a list
+        items = [data]
+        for part in prefix.split('.'):
+            if part == 'item':
+                items = [element for value in items for element in value]
+            else:
+                items = [value[part] for value in items]
+        yield from items
+        return
+    
+    with open(filename, 'rb') as f:
+        yield from ijson.items(f, prefix)
+
+
 def print_report_summary(report: Dict):
     """Print a formatted summary of the scraping report."""
     print("\n" + "="*50)
@@ -274,9 +336,8 @@ def print_report_summary(report: Dict):
         print(f"  {rating} stars: {count} businesses")
     
     print("\nTop Categories:")
-    categories = report.get('categories', {})
-    sorted_categories = sorted(categories.items(), key=lambda x: x[1], reverse=True)[:5]
-    for category, count in sorted_categories:
+    categories = Counter(report.get('categories', {}))
+    for category, count in categories.most_common(5):
         print(f"  {category}: {count} businesses")
     
     print("\nTop Rated Businesses:")